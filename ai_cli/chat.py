@@ -1,18 +1,27 @@
 """Chat session management for persistent conversation history."""
 
-import json
+import heapq
+import os
 import re
 import secrets
 import string
+import tempfile
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 from .constants import CONFIG_DIR
+from .fastjson import JSONDecodeError, dumps, loads
 
 
 CHATS_DIR = CONFIG_DIR / "chats"
 
+# Parsed chat files by chat_id -> ((mtime_ns, size, inode), data), least recently used first
+_LOAD_CACHE: OrderedDict[str, tuple[tuple[int, int, int], dict]] = OrderedDict()
+_LOAD_CACHE_SIZE = 128
+
 
 @dataclass
 class Message:
@@ -48,8 +57,15 @@ class ChatSession:
 
     def add_message(self, role: str, content: str) -> None:
         """Add a message to the chat session."""
-        self.messages.append(Message(role=role, content=content))
-        self.updated_at = datetime.now().isoformat()
+        self.add_messages([(role, content)])
+
+    def add_messages(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Add several (role, content) messages, stamped with one shared timestamp."""
+        now = datetime.now().isoformat()
+        count = len(self.messages)
+        self.messages.extend(Message(role=role, content=content, timestamp=now) for role, content in pairs)
+        if len(self.messages) != count:
+            self.updated_at = now
 
     def format_history(self) -> str:
         """Format message history as a string for prompt injection."""
@@ -61,10 +77,22 @@ class ChatSession:
         return "\n\n".join(lines)
 
     def save(self) -> None:
-        """Save chat session to file."""
+        """Save chat session to file.
+
+        Written to a temp file in the same directory and renamed over the
+        old one, so a crash mid-write never leaves a truncated chat behind.
+        """
         CHATS_DIR.mkdir(parents=True, exist_ok=True)
-        with open(self.path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        fd, tmp = tempfile.mkstemp(dir=CHATS_DIR, prefix=f".{self.chat_id}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps(self.to_dict(), indent=True))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
 
     @classmethod
     def load(cls, chat_id: str) -> "ChatSession | None":
@@ -74,12 +102,29 @@ class ChatSession:
             return None
 
         path = CHATS_DIR / f"{chat_id}.json"
-        if not path.exists():
+        try:
+            st = path.stat()
+        except OSError:
             return None
 
+        # Reuse the parsed data while the file is unchanged (saves replace the
+        # file, so the inode changes even within one mtime tick)
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = _LOAD_CACHE.get(chat_id)
+        if cached is not None and cached[0] == stamp:
+            _LOAD_CACHE.move_to_end(chat_id)
+            data = cached[1]
+        else:
+            try:
+                data = loads(path.read_bytes())
+            except (JSONDecodeError, UnicodeDecodeError, OSError):
+                return None
+            _LOAD_CACHE[chat_id] = (stamp, data)
+            _LOAD_CACHE.move_to_end(chat_id)
+            if len(_LOAD_CACHE) > _LOAD_CACHE_SIZE:
+                _LOAD_CACHE.popitem(last=False)
+
         try:
-            with open(path) as f:
-                data = json.load(f)
             return cls(
                 chat_id=data["chat_id"],
                 model_alias=data["model_alias"],
@@ -87,7 +132,7 @@ class ChatSession:
                 created_at=data.get("created_at", datetime.now().isoformat()),
                 updated_at=data.get("updated_at", datetime.now().isoformat()),
             )
-        except (json.JSONDecodeError, OSError, KeyError, TypeError):
+        except (KeyError, TypeError):
             return None
 
     def to_dict(self) -> dict:
@@ -105,19 +150,21 @@ class ChatSession:
 
     def enforce_limit(self, max_chars: int = 4000, max_messages: int = 10) -> None:
         """Enforce sliding window limit on message history."""
-        if not self.messages:
-            return
+        messages = self.messages
+        # Total once, then a running count: no re-sum or list shift per trimmed message
+        total_chars = sum(len(msg.content) for msg in messages)
+        drop = 0
 
-        # Keep trimming until we fit both constraints
+        # Keep trimming the oldest messages until we fit both constraints
         while (
-            len(self.messages) > 1
-            and (
-                len(self.messages) > max_messages
-                or sum(len(msg.content) for msg in self.messages) > max_chars
-            )
+            len(messages) - drop > 1
+            and (len(messages) - drop > max_messages or total_chars > max_chars)
         ):
-            # Remove oldest message (index 0)
-            self.messages.pop(0)
+            total_chars -= len(messages[drop].content)
+            drop += 1
+
+        if drop:
+            del messages[:drop]
 
 
 @dataclass
@@ -150,33 +197,55 @@ class ChatManager:
         return ChatSession.load(chat_id)
 
     @staticmethod
-    def list_all() -> list[ChatSession]:
-        """List all chat sessions."""
+    def _scan() -> list[tuple[int, str]]:
+        """(mtime_ns, chat_id) for every chat file, in directory order, from one scan."""
         CHATS_DIR.mkdir(parents=True, exist_ok=True)
-        sessions = []
-        for path in CHATS_DIR.glob("*.json"):
-            chat_id = path.stem
+        found = []
+        with os.scandir(CHATS_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    try:
+                        found.append((entry.stat().st_mtime_ns, entry.name[:-5]))
+                    except FileNotFoundError:
+                        continue  # deleted since the scan started
+        return found
+
+    @staticmethod
+    def iter_all() -> Iterator[ChatSession]:
+        """Yield chat sessions newest file first, loading each only when it is reached."""
+        # heapify is linear; each session then costs one O(log n) pop, so a
+        # caller that stops early never pays for a full sort
+        heap = [(-mtime_ns, chat_id) for mtime_ns, chat_id in ChatManager._scan()]
+        heapq.heapify(heap)
+        while heap:
+            _, chat_id = heapq.heappop(heap)
             session = ChatSession.load(chat_id)
-            if session:
-                sessions.append(session)
-        return sorted(sessions, key=lambda s: s.updated_at, reverse=True)
+            if session is not None:
+                yield session
+
+    @staticmethod
+    def list_all() -> list[ChatSession]:
+        """List all chat sessions, most recently updated first."""
+        sessions = list(ChatManager.iter_all())
+        # Loaded newest-file-first, so this is nearly sorted already (a linear pass for
+        # timsort); updated_at still decides, as file mtimes can tie or be touched
+        sessions.sort(key=lambda s: s.updated_at, reverse=True)
+        return sessions
 
     @staticmethod
     def delete(chat_id: str) -> bool:
         """Delete a chat session. Returns True if deleted, False if not found."""
-        path = CHATS_DIR / f"{chat_id}.json"
-        if path.exists():
-            path.unlink()
-            return True
-        return False
+        # One unlink instead of exists() + unlink(), and no race between the two
+        try:
+            (CHATS_DIR / f"{chat_id}.json").unlink()
+        except FileNotFoundError:
+            return False
+        return True
 
     @staticmethod
     def get_latest() -> "ChatSession | None":
-        """Get most recently updated chat without loading all sessions."""
-        CHATS_DIR.mkdir(parents=True, exist_ok=True)
-        paths = list(CHATS_DIR.glob("*.json"))
-        if not paths:
-            return None
-        # Sort by modification time (most recent first)
-        paths.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return ChatSession.load(paths[0].stem)
+        """Get most recently updated chat without loading all sessions.
+
+        Unreadable or corrupt files are passed over in favour of the next newest.
+        """
+        return next(ChatManager.iter_all(), None)
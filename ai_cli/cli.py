@@ -1,15 +1,22 @@
 """CLI entry point and command handling for ai-cli."""
 
 import argparse
+import codecs
+import contextlib
+import functools
 import platform
 import os
 import re
+import select
 import subprocess
 import sys
 import time
+from collections import ChainMap, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Iterator
 
-from .aliases import resolve_alias, KNOWN_PROVIDERS
+from .aliases import resolve_alias, list_aliases_by_provider, KNOWN_PROVIDERS
 from .config import Config, load_config
 from .constants import DEFAULT_ALIASES, RESERVED_COMMANDS
 from .exceptions import AIError, UnknownAliasError
@@ -23,15 +30,22 @@ try:
 except ImportError:
     HAS_TERMIOS = False
 
+_ESC_SEQUENCE_TIMEOUT = 0.05  # Seconds to wait for the rest of an escape sequence after ESC
+
 # File context constants
 _MAX_FILE_SIZE = 1024 * 1024  # 1 MB per file
 _MAX_TOTAL_SIZE = 5 * 1024 * 1024  # 5 MB total limit
-_BINARY_EXTENSIONS = frozenset({
+_FILE_READ_WORKERS = 8  # Concurrent reads for multi-file context
+_NULL_PROBE_SIZE = 8192  # Bytes checked for a null byte when sniffing binary files
+_RAW_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)  # O_BINARY: no newline translation on Windows
+_BINARY_EXTENSIONS: frozenset[str] = frozenset({  # lowercase, with leading dot
     '.pyc', '.so', '.dll', '.exe', '.bin', '.png', '.jpg', '.jpeg',
     '.gif', '.zip', '.tar', '.gz', '.pdf', '.docx', '.sqlite', '.class', '.jar',
     '.bmp', '.tiff', '.webp', '.svg', '.ico', '.mp3', '.mp4', '.wav', '.avi',
     '.mov', '.mkv', '.flac', '.ogg', '.woff', '.woff2', '.ttf', '.eot',
 })
+# Same extensions without the dot, so the hot check needs no '.' + ext concatenation
+_BINARY_EXT_NAMES: frozenset[str] = frozenset(ext[1:] for ext in _BINARY_EXTENSIONS)
 
 
 def die(msg: str, hint: str | None = None) -> None:
@@ -77,15 +91,15 @@ def run_init() -> None:
                 models[provider_name] = provider_cls.KNOWN_MODELS
                 print(f"  {provider_name} models: {', '.join(models[provider_name])}")
 
-    # Build aliases
-    aliases = dict(DEFAULT_ALIASES)
-
-    # Generate aliases for providers that support it
+    # Generate aliases for providers that support it (layered view, later providers win)
+    generated: list[dict] = []
     for provider_name, provider_cls in PROVIDERS.items():
         if hasattr(provider_cls, "generate_aliases"):
             provider_models = models.get(provider_name, [])
             if provider_models:
-                aliases.update(provider_cls.generate_aliases(provider_models, aliases))
+                existing = ChainMap(*reversed(generated), DEFAULT_ALIASES)
+                generated.append(provider_cls.generate_aliases(provider_models, existing))
+    aliases = dict(ChainMap(*reversed(generated), DEFAULT_ALIASES))
 
     # Update config
     config.models = models
@@ -118,6 +132,9 @@ def show_list() -> None:
         elif current != model and len(alias) < len(current):
             model_to_alias[key] = alias
 
+    # Group aliases by provider once instead of rescanning all aliases per provider
+    aliases_by_provider = list_aliases_by_provider(config)
+
     print("Available models:")
 
     # Track which aliases are displayed via the model list
@@ -135,8 +152,8 @@ def show_list() -> None:
                     print(f"    {model}")
 
             # Show aliases with options (e.g. @effort) not covered by KNOWN_MODELS
-            for alias, (prov, model) in sorted(aliases.items()):
-                if prov == provider and alias not in displayed_aliases and "@" in model:
+            for alias, model in sorted(aliases_by_provider.get(provider, [])):
+                if alias not in displayed_aliases and "@" in model:
                     base_model, option = model.rsplit("@", 1)
                     print(f"    {alias:20} -> {base_model} ({option})")
                     displayed_aliases.add(alias)
@@ -262,6 +279,10 @@ def sanitize_command(text: str) -> str:
     """Strip markdown code blocks, emojis, shell prompts, and other non-command text."""
     text = text.strip()
 
+    # Fast path: a bare single-line command needs no cleanup
+    if text[:1].isascii() and text[:1].isalpha() and "`" not in text and "\n" not in text:
+        return text
+
     # Remove leading emojis and whitespace
     while text and (_is_emoji(text[0]) or text[0] in ' \t'):
         text = text[1:]
@@ -292,141 +313,273 @@ def sanitize_command(text: str) -> str:
     return first_line.strip()
 
 
+@contextlib.contextmanager
+def raw_mode(fd: int) -> Iterator[None]:
+    """Put the terminal into raw mode for the duration of the block."""
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
 def read_keypress() -> str | None:
     """Read a single keypress without waiting for Enter. Returns key or None on error."""
     if not HAS_TERMIOS or not sys.stdin.isatty():
         return None
     fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    try:
-        tty.setraw(fd)
-        ch = sys.stdin.read(1)
-        if ch == '\x1b':  # ESC
-            import select
-            if select.select([sys.stdin], [], [], 0.05)[0]:
-                sys.stdin.read(2)
+    with raw_mode(fd):
+        data = os.read(fd, 1)
+        if data == b'\x1b':  # ESC, alone or leading a sequence (ESC [ A, ESC [ 1 5 ~)
+            # Swallow the rest of the sequence so it doesn't leak into the next read
+            while select.select([fd], [], [], _ESC_SEQUENCE_TIMEOUT)[0] and os.read(fd, 32):
+                pass
             return 'esc'
-        return ch
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        # A multi-byte UTF-8 character arrives as several bytes; read until it is complete
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        while data:
+            if ch := decoder.decode(data):
+                return ch[:1]
+            data = os.read(fd, 1)
+    return decoder.decode(b'', final=True)[:1]
+
+
+@dataclass(slots=True)
+class _FileVerdict:
+    """What _classify_file learned about a file, so the reader doesn't stat or read it again."""
+
+    skip: bool
+    reason: str | None = None  # Warning to show for the skip (None for a silent skip)
+    size: int = 0
+    head: bytes = b''  # Leading bytes already read for the null-byte probe
+
+
+def _has_binary_extension(name: str) -> bool:
+    """Check a file name against known binary types (rpartition skips PurePath.suffix parsing)."""
+    stem, _, ext = name.rpartition('.')
+    return bool(stem) and ext.lower() in _BINARY_EXT_NAMES
+
+
+def _classify_file(path: "Path", size: int | None = None) -> _FileVerdict:
+    """Decide whether to skip a file as binary or too large.
 
+    Checks run cheapest first: extension (no syscall), size (a stat, unless
+    size is passed in from e.g. scandir), then the null-byte probe (a read).
+    """
+    if _has_binary_extension(path.name):
+        return _FileVerdict(skip=True)
 
-def _should_skip_file(path: "Path") -> bool:
-    """Skip binary files, large files, and common patterns."""
     # Check file size
     try:
-        if path.stat().st_size > _MAX_FILE_SIZE:
-            print(f"[Skipping {path}: file larger than {_MAX_FILE_SIZE // (1024*1024)}MB]", file=sys.stderr)
-            return True
+        if size is None:
+            size = path.stat().st_size
     except Exception:
-        return True
+        return _FileVerdict(skip=True)
+    if size > _MAX_FILE_SIZE:
+        return _FileVerdict(skip=True, reason=f"[Skipping {path}: file larger than {_MAX_FILE_SIZE // (1024*1024)}MB]", size=size)
 
-    # Check extension against known binary types
-    if path.suffix.lower() in _BINARY_EXTENSIONS:
-        return True
     # Try to detect binary by reading a bit (null byte check)
     try:
-        with open(path, 'rb') as f:
-            chunk = f.read(1024)
-            if b'\x00' in chunk:
-                return True
+        head = _read_head(path)
     except Exception:
-        return True
-    return False
+        return _FileVerdict(skip=True, size=size)
+    if b'\x00' in head:
+        return _FileVerdict(skip=True, size=size)
+    return _FileVerdict(skip=False, size=size, head=head)
+
+
+def _read_head(path: "Path") -> bytes:
+    """Read the start of a file with one raw read (no io buffering layer)."""
+    fd = os.open(path, _RAW_READ_FLAGS)
+    try:
+        return os.read(fd, _NULL_PROBE_SIZE)
+    finally:
+        os.close(fd)
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode file bytes as UTF-8 text in one call (no TextIOWrapper)."""
+    # errors='replace' prevents crashes on non-UTF-8 files
+    text = data.decode('utf-8', 'replace')
+    # Match text-mode reads: normalize \r\n and lone \r to \n
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _read_rest(path: "Path", head: bytes, size: int) -> bytes:
+    """Return the whole file, continuing after the already-read head.
+
+    The rest is read through a memoryview straight into a buffer presized
+    from the stat, so the head is never concatenated into a second copy.
+    """
+    if len(head) < _NULL_PROBE_SIZE:
+        return head  # Short read: the head is the whole file
+    buf = bytearray(max(size, len(head)))
+    filled = len(head)
+    buf[:filled] = head
+    with open(path, 'rb', buffering=0) as f, memoryview(buf) as view:
+        f.seek(filled)
+        while filled < len(buf):
+            n = f.readinto(view[filled:])
+            if not n:
+                break
+            filled += n
+    del buf[filled:]  # File shrank since the stat
+    return buf
+
+
+def _read_context_file(path: "Path", from_dir: bool, size: int | None = None) -> tuple[int, str | None, str | None]:
+    """Read one context file; safe to run on a worker thread.
+
+    Returns (size, content, warning). content is None when the file is not
+    included; warnings are returned instead of printed so the caller can emit
+    them in input order. Errors on explicitly named files propagate.
+    """
+    if from_dir:
+        # Skip binary files, common ignore patterns
+        verdict = _classify_file(path, size)
+        if verdict.skip:
+            return 0, None, verdict.reason
+        try:
+            return verdict.size, _decode_text(_read_rest(path, verdict.head, verdict.size)), None
+        except Exception:
+            return 0, None, None  # Skip unreadable files
+
+    file_size = path.stat().st_size if size is None else size
+    return file_size, _decode_text(path.read_bytes()), None
+
+
+def _read_within_budget(jobs: list[tuple], executor: ThreadPoolExecutor | None, window: int) -> Iterator[tuple[int, str | None, str | None]]:
+    """Yield _read_context_file results for (ref, path, from_dir, size) jobs, in input order.
+
+    Reads run up to `window` files ahead, but a read starts only once its file
+    fits the total size limit even if every read ahead of it is included, so
+    nothing past _MAX_TOTAL_SIZE is read in full. A file that cannot fit is
+    yielded unread with content None; directory entries still get the cheap
+    binary checks first, so a skipped binary doesn't end the scan.
+    """
+    total = 0
+    reserved = 0  # Bytes the reads in flight may still add to total
+    pending: deque = deque()  # (size, result getter) for reads in flight, in input order
+    upcoming = deque(jobs)
+    for _ in jobs:
+        while upcoming and len(pending) < window and total + reserved + upcoming[0][3] <= _MAX_TOTAL_SIZE:
+            _, path, from_dir, size = upcoming.popleft()
+            read = functools.partial(_read_context_file, path, from_dir, size)
+            pending.append((size, executor.submit(read).result if executor else read))
+            reserved += size
+        if pending:
+            size, get_result = pending.popleft()
+            reserved -= size
+            result = get_result()
+        else:
+            _, path, from_dir, size = upcoming.popleft()
+            verdict = _classify_file(path, size) if from_dir else None
+            result = (0, None, verdict.reason) if verdict and verdict.skip else (size, None, None)
+        if result[1] is not None:
+            total += result[0]
+        yield result
 
 
 def _read_file_context(file_refs: list[str]) -> str:
     """Read file(s) and return formatted context string with headers."""
     from pathlib import Path
 
-    total_size = 0
-    seen_paths = set()  # Deduplication
+    # Expand comma-separated values; dict.fromkeys drops repeated refs, keeping order
+    all_refs = dict.fromkeys(ref for refs in file_refs for ref in refs.split(","))
 
-    parts = []
-    # Expand comma-separated values
-    all_refs = []
-    for ref in file_refs:
-        all_refs.extend(ref.split(","))
-
-    cwd = Path(os.getcwd()).resolve()
+    # Resolve CWD once; candidates are checked with a plain string prefix test.
+    # The trailing separator keeps /foo from matching /foobar.
+    cwd = os.path.realpath(os.getcwd())
+    cwd_prefix = os.path.join(cwd, '')
+    norm_prefix = os.path.normcase(cwd_prefix)
 
+    # Resolve and validate every reference first. Keyed by resolved path, so
+    # the same file named twice (or also found via its directory) is read
+    # once, at its first position: path -> (ref, path, from_dir, size or None)
+    files = {}
     for ref in all_refs:
-        path = Path(ref).resolve()
+        real = os.path.realpath(ref)
 
         # SECURITY: Prevent path traversal outside CWD
-        try:
-            path.relative_to(cwd)
-        except ValueError:
+        if real != cwd and not os.path.normcase(real).startswith(norm_prefix):
             die(f"Path outside current directory: {ref}", hint="Files must be within the current working directory")
+        path = Path(real)
 
         if not path.exists():
             die(f"File not found: {ref}")
 
         if path.is_file():
-            if str(path) in seen_paths:
-                continue  # Skip duplicates
-            seen_paths.add(str(path))
-
-            try:
-                file_size = path.stat().st_size
-                if total_size + file_size > _MAX_TOTAL_SIZE:
-                    print(f"[Skipping {path}: total size limit ({_MAX_TOTAL_SIZE // (1024*1024)}MB) exceeded]", file=sys.stderr)
-                    break
-
-                total_size += file_size
-
-                # Use relative path for privacy (don't leak absolute paths to LLM)
-                rel_path = path.relative_to(cwd)
-                # errors='replace' prevents crashes on non-UTF-8 files
-                content = path.read_text(errors='replace')
-                parts.append(f'<file path="{rel_path}">\n{content}\n</file>')
-            except Exception as e:
-                die(f"Error reading file {ref}: {e}")
+            if real not in files:
+                try:
+                    files[real] = (ref, path, False, path.stat().st_size)
+                except OSError as e:
+                    die(f"Error reading file {ref}: {e}")
         elif path.is_dir():
-            # Read all files in directory (top-level only, not recursive)
-            for file_path in sorted(path.iterdir()):
+            # Read all files in directory (top-level only, not recursive).
+            # scandir classifies entries from the directory read itself and
+            # caches their stat, so each file costs one stat at most.
+            with os.scandir(real) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+            for entry in entries:
                 # SECURITY: Skip hidden files/dirs (don't leak .env, .git, etc.)
-                if file_path.name.startswith('.'):
+                if entry.name.startswith('.') or entry.path in files:
                     continue
-                if not file_path.is_file():
+                # Known binary types are dropped by name, before any stat
+                if _has_binary_extension(entry.name):
                     continue
-
-                # Skip duplicates
-                if str(file_path) in seen_paths:
-                    continue
-                seen_paths.add(str(file_path))
-
-                # Skip binary files, common ignore patterns
-                if _should_skip_file(file_path):
-                    continue
-
                 try:
-                    file_size = file_path.stat().st_size
-                    if total_size + file_size > _MAX_TOTAL_SIZE:
-                        print(f"[Skipping remaining files: total size limit ({_MAX_TOTAL_SIZE // (1024*1024)}MB) exceeded]", file=sys.stderr)
-                        break
-
-                    total_size += file_size
-
-                    # Use relative path for privacy
-                    rel_path = file_path.relative_to(cwd)
-                    # errors='replace' for encoding robustness
-                    content = file_path.read_text(errors='replace')
-                    parts.append(f'<file path="{rel_path}">\n{content}\n</file>')
-                except Exception:
-                    pass  # Skip unreadable files
-            else:
-                continue  # Continue to next ref if no break
-            break  # Break outer loop if inner loop hit total limit
+                    if not entry.is_file():
+                        continue
+                    file_size = entry.stat().st_size
+                except OSError:
+                    continue
+                files[entry.path] = (ref, Path(entry.path), True, file_size)
         else:
             die(f"Not a file or directory: {ref}")
 
-    return "\n\n".join(parts)
+    # Files are independent and I/O-bound: read them concurrently, then
+    # apply the total size limit in input order
+    jobs = list(files.values())
+    window = min(_FILE_READ_WORKERS, len(jobs))
 
+    total_size = 0
+    parts = []
+    with contextlib.ExitStack() as stack:
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=window)) if window > 1 else None
+        results = _read_within_budget(jobs, executor, window)
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser."""
-    epilog = """
+        for ref, path, from_dir, _ in jobs:
+            try:
+                file_size, content, warning = next(results)
+            except Exception as e:
+                die(f"Error reading file {ref}: {e}")
+            if warning:
+                print(warning, file=sys.stderr)
+
+            if total_size + file_size > _MAX_TOTAL_SIZE:
+                if from_dir:
+                    print(f"[Skipping remaining files: total size limit ({_MAX_TOTAL_SIZE // (1024*1024)}MB) exceeded]", file=sys.stderr)
+                else:
+                    print(f"[Skipping {path}: total size limit ({_MAX_TOTAL_SIZE // (1024*1024)}MB) exceeded]", file=sys.stderr)
+                break
+            if content is None:
+                continue
+
+            total_size += file_size
+            # Use relative path for privacy (don't leak absolute paths to LLM)
+            rel_path = str(path)[len(cwd_prefix):]
+            # Content goes in as its own fragment so it is copied once, by the final join
+            if parts:
+                parts.append('\n\n')
+            parts += (f'<file path="{rel_path}">\n', content, '\n</file>')
+
+    return ''.join(parts)
+
+
+_EPILOG = """
 examples:
   ai sonnet "explain this"      Start new chat (auto-saves)
   ai chat ABC "continue"        Continue chat ABC
@@ -439,11 +592,15 @@ examples:
   ai run "stop nginx"           Generate + execute
   ai serve                      Start HTTP server
 """
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
     parser = argparse.ArgumentParser(
         prog="ai",
         description="Unified AI CLI dispatcher",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=epilog,
+        epilog=_EPILOG,
     )
     parser.add_argument("--json", "-j", action="store_true", help="JSON output (or use bare: json)")
     parser.add_argument("--cmd", "-c", action="store_true", help="Shell command only (or use bare: cmd)")
@@ -457,18 +614,25 @@ examples:
     return parser
 
 
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    """Get the shared argument parser, built on first use only."""
+    return create_parser()
+
+
+_FLAG_WORDS = {"json": "--json", "cmd": "--cmd", "run": "--run", "yolo": "--yolo", "reply": "--reply"}
+
+
 def normalize_args(argv: list[str]) -> list[str]:
     """Convert legacy bare keywords to flags for backwards compat."""
-    flag_words = {"json": "--json", "cmd": "--cmd", "run": "--run", "yolo": "--yolo", "reply": "--reply"}
-    return [flag_words.get(arg, arg) for arg in argv]
+    if _FLAG_WORDS.keys().isdisjoint(argv):
+        return argv  # Common case: nothing to rewrite, no copy
+    return [_FLAG_WORDS.get(arg, arg) for arg in argv]
 
 
 def _is_provider_model_format(arg: str) -> bool:
     """Check if arg is in provider:model format with a valid provider."""
-    if ":" not in arg:
-        return False
-    provider = arg.split(":", 1)[0]
-    return provider in KNOWN_PROVIDERS
+    return ":" in arg and arg.partition(":")[0] in KNOWN_PROVIDERS
 
 
 def detect_chat_mode(argv: list[str], config: Config) -> dict:
@@ -592,38 +756,38 @@ def dispatch(provider: str, model: str, prompt: str, json_output: bool, yolo: bo
 
 
 def dispatch_multi(aliases: list[str], prompt: str, config: Config, json_output: bool = False, yolo: bool = False) -> None:
-    """Run multiple models in parallel and print labeled results."""
+    """Run multiple models in parallel and print labeled results as they complete."""
 
-    def call_model(alias: str) -> tuple[str, str, float, str | None]:
+    def call_model(alias: str, provider: str, model: str) -> tuple[str, str, float, str | None]:
         """Call a single model, return (alias, result, elapsed, error)."""
-        import time
         start = time.time()
         try:
-            from .aliases import resolve_alias
-            provider, model = resolve_alias(alias, config)
             result = dispatch(provider, model, prompt, json_output, yolo=yolo)
             return (alias, result, time.time() - start, None)
         except Exception as e:
             return (alias, "", time.time() - start, str(e))
 
-    import time
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    results: dict[str, tuple[str, float, str | None]] = {}
+    # Resolve every alias up front so a bad one fails before any thread starts
+    resolved: list[tuple[str, str, str]] = []
+    for alias in aliases:
+        try:
+            resolved.append((alias, *resolve_alias(alias, config)))
+        except UnknownAliasError:
+            die(f"unknown model '{alias}'. Run 'ai list' to see available models.")
+
     with ThreadPoolExecutor(max_workers=len(aliases)) as executor:
-        futures = {executor.submit(call_model, alias): alias for alias in aliases}
-        for future in as_completed(futures):
+        futures = [executor.submit(call_model, *entry) for entry in resolved]
+        # Print each result as soon as it arrives (fastest model first)
+        for i, future in enumerate(as_completed(futures)):
             alias, result, elapsed, error = future.result()
-            results[alias] = (result, elapsed, error)
-
-    for i, alias in enumerate(aliases):
-        result, elapsed, error = results[alias]
-        print(f"[1;36m━━━ {alias} [0;90m({elapsed:.1f}s)[1;36m ━━━[0m")
-        if error:
-            print(f"[31mError: {error}[0m")
-        else:
-            print(result)
-        if i < len(aliases) - 1:
-            print()
+            if i:
+                print()
+            print(f"[1;36m━━━ {alias} [0;90m({elapsed:.1f}s, {i + 1}/{len(aliases)})[1;36m ━━━[0m")
+            if error:
+                print(f"[31mError: {error}[0m")
+            else:
+                print(result)
+            sys.stdout.flush()
 
 
 def main() -> None:
@@ -745,11 +909,16 @@ def main() -> None:
         if config.default_alias and not sys.stdin.isatty():
             pass
         else:
-            create_parser().print_help()
+            _get_parser().print_help()
             return
 
-    parser = create_parser()
-    args = parser.parse_intermixed_args(normalize_args(argv))
+    argv = normalize_args(argv)
+    parser = _get_parser()
+    # Intermixed parsing (two passes) is only needed when flags follow positionals
+    if any(arg.startswith("-") for arg in argv):
+        args = parser.parse_intermixed_args(argv)
+    else:
+        args = parser.parse_args(argv)
     aliases = config.aliases
     positionals = args.args
     model_args: list[str] = []
@@ -762,7 +931,7 @@ def main() -> None:
             break
 
     if prompt_start < len(positionals):
-        prompt = " ".join(positionals[prompt_start:])
+        prompt = " ".join(positionals[prompt_start:] if prompt_start else positionals)
     elif not sys.stdin.isatty():
         prompt = sys.stdin.read().strip()
     elif model_args:
@@ -779,10 +948,8 @@ def main() -> None:
     if not model_args:
         default_alias = config.default_alias
         if default_alias:
-            if positionals:
-                model_args = [default_alias]
-                prompt = " ".join(positionals)
-            elif prompt:
+            # prompt_start is 0 here, so the prompt already holds every positional
+            if positionals or prompt:
                 model_args = [default_alias]
             else:
                 die("model or prompt required")
@@ -856,8 +1023,7 @@ def main() -> None:
     try:
         result = dispatch(provider, model, prompt, args.json, args.yolo if not args.run else False)
         if session:
-            session.add_message("user", original_prompt)
-            session.add_message("assistant", result)
+            session.add_messages([("user", original_prompt), ("assistant", result)])
             session.model_alias = model_arg
             session.save()
         if args.cmd or args.run:
@@ -881,7 +1047,10 @@ def main() -> None:
                     elif key in ('esc', 'n', 'N', '\x03'): print("Cancelled."); return
                     elif key not in ('\r', '\n', ' ', 'y', 'Y'): print("Cancelled."); return
                 except (KeyboardInterrupt, EOFError): print("\nCancelled."); return
-            import subprocess
+            sys.stdout.flush(); sys.stderr.flush()
+            if os.name == "posix":
+                # Replace this process with the shell (no extra fork, signals go straight through)
+                os.execv("/bin/sh", ["/bin/sh", "-c", result])
             exec_result = subprocess.run(result, shell=True)
             sys.exit(exec_result.returncode)
         else:
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Any
 
 from .aliases import resolve_alias
-from .config import Config, load_config
+from .config import Config, clear_config_cache, load_config
 from .exceptions import AIError, ProviderError, UnknownAliasError
 from .providers import PROVIDERS, get_provider_instance
 
@@ -41,6 +41,8 @@ class AIClient:
         self._config_lock = threading.Lock()
         self._providers: dict = {}
         self._providers_lock = threading.Lock()
+        # alias -> (config alias entry it was resolved from, provider instance, model)
+        self._resolved: dict[str, tuple[Any, Any, str]] = {}
 
     @property
     def config(self) -> Config:
@@ -54,8 +56,10 @@ class AIClient:
 
     def reload_config(self) -> None:
         """Force reload configuration from disk."""
+        clear_config_cache()
         self._config = None
         self._providers.clear()
+        self._resolved.clear()
 
     def call(
         self,
@@ -80,8 +84,7 @@ class AIClient:
             UnknownAliasError: If the alias cannot be resolved
             ProviderError: If the provider fails to execute
         """
-        provider_name, model = resolve_alias(alias, self.config)
-        provider = self._get_provider(provider_name)
+        provider, model = self._resolve_provider(alias)
         return provider.call(model, prompt, json_output=json_mode, yolo=yolo)
 
     def call_direct(
@@ -125,22 +128,44 @@ class AIClient:
         Returns:
             Dict mapping alias to response string or Exception if failed
         """
-        def call_one(alias: str) -> tuple[str, str | Exception]:
+        def call_one(alias: str, provider_name: str, model: str) -> tuple[str, str | Exception]:
             try:
-                return (alias, self.call(alias, prompt, json_mode=json_mode))
+                return (alias, self.call_direct(provider_name, model, prompt, json_mode=json_mode))
             except Exception as e:
                 return (alias, e)
 
+        # Resolve up front; unknown aliases are reported without spawning a worker
         results: dict[str, str | Exception] = {}
-        with ThreadPoolExecutor(max_workers=len(aliases)) as executor:
-            futures = {executor.submit(call_one, alias): alias for alias in aliases}
-            for future in as_completed(futures):
-                alias, result = future.result()
-                results[alias] = result
+        resolved: list[tuple[str, str, str]] = []
+        for alias in aliases:
+            try:
+                resolved.append((alias, *resolve_alias(alias, self.config)))
+            except UnknownAliasError as e:
+                results[alias] = e
+
+        if resolved:
+            with ThreadPoolExecutor(max_workers=len(resolved)) as executor:
+                futures = [executor.submit(call_one, *entry) for entry in resolved]
+                for future in as_completed(futures):
+                    alias, result = future.result()
+                    results[alias] = result
 
         # Return in original order
         return {alias: results[alias] for alias in aliases}
 
+    def _resolve_provider(self, alias: str) -> tuple[Any, str]:
+        """Resolve an alias straight to (provider instance, model), memoized per alias."""
+        # The memo is valid while the alias still maps to the same config entry
+        # (None for provider:model strings), so edits to config.aliases are picked up.
+        source = self.config.aliases.get(alias)
+        cached = self._resolved.get(alias)
+        if cached is not None and cached[0] is source:
+            return cached[1], cached[2]
+        provider_name, model = resolve_alias(alias, self.config)
+        provider = self._get_provider(provider_name)
+        self._resolved[alias] = (source, provider, model)
+        return provider, model
+
     def _get_provider(self, name: str):
         """Get or create a provider instance (thread-safe)."""
         if name not in self._providers:
@@ -226,8 +251,7 @@ class AIClient:
             True if the alias can be resolved and its provider is available
         """
         try:
-            provider_name, _ = resolve_alias(alias, self.config)
-            provider = self._get_provider(provider_name)
+            provider, _ = self._resolve_provider(alias)
             return provider.is_available()
         except (UnknownAliasError, ValueError):
             return False
@@ -1,22 +1,22 @@
 """Configuration management for ai-cli."""
 
-import json
-import shutil
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from .constants import CONFIG_DIR, CONFIG_FILE, DEFAULT_ALIASES
 from .exceptions import ConfigError
+from .fastjson import JSONDecodeError, dumps, loads
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Configuration container for ai-cli."""
 
     installed_tools: list[str] = field(default_factory=list)
     models: dict[str, list[str]] = field(default_factory=dict)
-    aliases: dict[str, tuple[str, str]] = field(default_factory=lambda: dict(DEFAULT_ALIASES))
+    aliases: dict[str, tuple[str, str]] = field(default_factory=DEFAULT_ALIASES.copy)
     default_alias: str | None = None
 
     _path: Path | None = field(default=None, repr=False)
@@ -31,34 +31,87 @@ class Config:
         """Load config from file or return defaults."""
         config_path = path or CONFIG_FILE
         if config_path.exists():
-            try:
-                with open(config_path) as f:
-                    data = json.load(f)
-                return cls(
-                    installed_tools=data.get("installed_tools", []),
-                    models=data.get("models", {}),
-                    aliases=cls._parse_aliases(data.get("aliases", DEFAULT_ALIASES)),
-                    default_alias=data.get("default_alias"),
-                    _path=config_path,
-                )
-            except json.JSONDecodeError as e:
-                raise ConfigError(f"Invalid config file: {e}")
+            return cls._from_data(cls._read(config_path), config_path)
         return cls(_path=config_path)
 
-    @staticmethod
-    def _parse_aliases(aliases_data: dict) -> dict[str, tuple[str, str]]:
-        """Parse aliases from JSON (lists) to tuples."""
+    @classmethod
+    def _read(cls, config_path: Path) -> dict[str, Any]:
+        """Read and parse a config file into plain data."""
+        try:
+            data = loads(config_path.read_bytes())
+        except JSONDecodeError as e:
+            raise ConfigError(f"Invalid config file: {e}")
         return {
-            k: tuple(v) if isinstance(v, list) else v
-            for k, v in aliases_data.items()
+            "installed_tools": data.get("installed_tools", []),
+            "models": data.get("models", {}),
+            "aliases": cls._parse_aliases(data["aliases"]) if "aliases" in data else DEFAULT_ALIASES.copy(),
+            "default_alias": data.get("default_alias"),
         }
 
+    @classmethod
+    def _from_data(cls, data: dict[str, Any], config_path: Path) -> "Config":
+        """Build a Config from parsed data, copying containers so instances never share state."""
+        return cls(
+            installed_tools=list(data["installed_tools"]),
+            models={k: list(v) for k, v in data["models"].items()},
+            aliases=dict(data["aliases"]),
+            default_alias=data["default_alias"],
+            _path=config_path,
+        )
+
+    @staticmethod
+    def _parse_aliases(aliases_data: dict) -> dict[str, tuple[str, str]]:
+        """Parse aliases from JSON (lists) to tuples.
+
+        Tuples are kept deliberately: loaded configs share alias values through
+        the load_config() cache, so they must be immutable. The conversion runs
+        once per config file change, not once per load.
+        """
+        if not isinstance(aliases_data, dict):
+            raise ConfigError("Invalid config file: 'aliases' must be an object")
+        intern = sys.intern  # alias/provider names are hot dict keys; share one object each
+        aliases = {}
+        for k, value in aliases_data.items():
+            if not (isinstance(value, list) and len(value) == 2 and all(isinstance(v, str) for v in value)):
+                raise ConfigError(f"Invalid alias '{k}': expected [provider, model], got {value!r}")
+            provider, model = value
+            aliases[intern(k)] = (intern(provider), model)
+        return aliases
+
     def save(self, path: Path | None = None) -> None:
-        """Save config to file."""
+        """Save config to file (skipped when the file on disk already holds this state)."""
         config_path = path or self._path or CONFIG_FILE
+        if self._matches_disk(config_path):
+            return
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(config_path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        config_path.write_bytes(dumps(self.to_dict(), indent=True))
+        # Record what was just written, so the next load or save compares against
+        # it rather than against the state from the last load
+        try:
+            _CONFIG_CACHE[config_path] = (_file_stamp(config_path), {
+                "installed_tools": list(self.installed_tools),
+                "models": {k: list(v) for k, v in self.models.items()},
+                "aliases": dict(self.aliases),
+                "default_alias": self.default_alias,
+            })
+        except OSError:
+            _CONFIG_CACHE.pop(config_path, None)
+
+    def _matches_disk(self, config_path: Path) -> bool:
+        """Check if the unchanged file at config_path was last loaded with exactly this state."""
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is None:
+            return False
+        try:
+            stamp = _file_stamp(config_path)
+        except OSError:
+            return False
+        return cached[0] == stamp and cached[1] == {
+            "installed_tools": self.installed_tools,
+            "models": self.models,
+            "aliases": self.aliases,
+            "default_alias": self.default_alias,
+        }
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -70,9 +123,18 @@ class Config:
         }
 
     def detect_cli_tools(self) -> list[str]:
-        """Detect which CLI tools are installed."""
+        """Detect which CLI tools are installed.
+
+        Always rescans PATH: this backs 'ai init', which users run right after
+        installing a tool. Across invocations the result is already cached as
+        installed_tools in config.json, so startup never scans PATH.
+        """
+        from .providers.cli import cached_which
+
+        # Warm the per-process cache for is_available() while detecting
+        cached_which.cache_clear()
         tools = ["codex", "claude", "gemini", "qwen", "ollama"]
-        self.installed_tools = [tool for tool in tools if shutil.which(tool)]
+        self.installed_tools = [tool for tool in tools if cached_which(tool)]
         return self.installed_tools
 
     def set_default(self, alias: str | None) -> None:
@@ -98,9 +160,38 @@ class Config:
         return False
 
 
+# Parsed config data keyed by path -> ((ino, mtime_ns, ctime_ns, size), data)
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int, int, int], dict[str, Any]]] = {}
+
+
+def _file_stamp(path: Path) -> tuple[int, int, int, int]:
+    """Identify the current version of a file for _CONFIG_CACHE (raises OSError if missing).
+
+    The inode catches atomic replace-by-rename and ctime catches rewrites whose
+    mtime was restored, which (mtime, size) alone would miss.
+    """
+    st = path.stat()
+    return (st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+
+
 def load_config(path: Path | None = None) -> Config:
-    """Load configuration from file."""
-    return Config.load(path)
+    """Load configuration from file, reusing the parsed data while the file is unchanged."""
+    config_path = path or CONFIG_FILE
+    try:
+        stamp = _file_stamp(config_path)
+    except OSError:
+        return Config(_path=config_path)
+
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, Config._read(config_path))
+        _CONFIG_CACHE[config_path] = cached
+    return Config._from_data(cached[1], config_path)
+
+
+def clear_config_cache() -> None:
+    """Drop all cached config data so the next load re-reads from disk."""
+    _CONFIG_CACHE.clear()
 
 
 def get_default_config() -> Config:
@@ -1,19 +1,23 @@
 """Constants and default configurations for ai-cli."""
 
 from pathlib import Path
+from types import MappingProxyType
 
 # Timeout for prompt execution across all providers (20 minutes)
 EXECUTION_TIMEOUT = 1200
 
+# Timeout for establishing HTTP API connections (TCP + TLS), separate from the read timeout
+CONNECT_TIMEOUT = 5
+
 # Config file location
 CONFIG_DIR = Path.home() / ".ai-cli"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
 # Reserved command names (cannot be used as aliases)
-RESERVED_COMMANDS = {"init", "list", "default", "cmd", "json", "help", "yolo", "run", "completions", "serve", "chat", "reply"}
+RESERVED_COMMANDS = frozenset({"init", "list", "default", "cmd", "json", "help", "yolo", "run", "completions", "serve", "chat", "reply"})
 
-# Default aliases: alias -> (provider, model)
-DEFAULT_ALIASES = {
+# Default aliases: alias -> (provider, model), read-only (copy before mutating)
+DEFAULT_ALIASES = MappingProxyType({
     # Claude CLI (Anthropic)
     "claude": ("claude", "sonnet"),
     "haiku": ("claude", "haiku"),
@@ -53,4 +57,4 @@ DEFAULT_ALIASES = {
     "chimera": ("openrouter", "tngtech/deepseek-r1t2-chimera:free"),
     "devstral": ("openrouter", "mistralai/devstral-2512:free"),
     "oss": ("openrouter", "openai/gpt-oss-120b:free"),
-}
+})
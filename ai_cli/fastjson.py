@@ -0,0 +1,31 @@
+"""JSON encode/decode helpers: orjson when installed, stdlib json fallback.
+
+Both paths work in bytes so callers can hand results straight to files and
+sockets without an extra str round-trip.
+"""
+
+import json
+from typing import Any
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (2-space indent if requested)."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+except ImportError:
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (2-space indent if requested)."""
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
@@ -1,14 +1,9 @@
 """Provider implementations for ai-cli."""
 
+import importlib
+from collections.abc import Iterator, Mapping
+
 from .base import BaseProvider, Provider
-from .cli import CLIConfig, CLIProvider
-from .claude import ClaudeProvider
-from .codex import CodexProvider
-from .gemini import GeminiProvider
-from .qwen import QwenProvider
-from .ollama import OllamaProvider
-from .openrouter import OpenRouterProvider
-from .glm import GLMProvider
 
 __all__ = [
     "Provider",
@@ -24,23 +19,77 @@ __all__ = [
     "GLMProvider",
 ]
 
-# Provider registry for easy lookup by name
-PROVIDERS = {
-    "claude": ClaudeProvider,
-    "codex": CodexProvider,
-    "gemini": GeminiProvider,
-    "qwen": QwenProvider,
-    "ollama": OllamaProvider,
-    "openrouter": OpenRouterProvider,
-    "glm": GLMProvider,
+# Lazily imported names: attribute -> (submodule, attribute)
+_LAZY_ATTRS = {
+    "CLIConfig": (".cli", "CLIConfig"),
+    "CLIProvider": (".cli", "CLIProvider"),
+    "ClaudeProvider": (".claude", "ClaudeProvider"),
+    "CodexProvider": (".codex", "CodexProvider"),
+    "GeminiProvider": (".gemini", "GeminiProvider"),
+    "QwenProvider": (".qwen", "QwenProvider"),
+    "OllamaProvider": (".ollama", "OllamaProvider"),
+    "OpenRouterProvider": (".openrouter", "OpenRouterProvider"),
+    "GLMProvider": (".glm", "GLMProvider"),
 }
 
 
+def _import_attr(name: str):
+    """Import a lazily registered attribute and cache it on the package."""
+    module_name, attr = _LAZY_ATTRS[name]
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str):
+    """Resolve provider classes on first access (PEP 562)."""
+    if name in _LAZY_ATTRS:
+        return _import_attr(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _ProviderRegistry(Mapping):
+    """Name -> provider class mapping that imports each provider module on first lookup."""
+
+    def __init__(self, table: dict[str, str]):
+        self._table = table  # provider name -> class attribute name
+
+    def __getitem__(self, name: str) -> type[BaseProvider]:
+        attr = self._table[name]
+        return globals().get(attr) or _import_attr(attr)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._table
+
+
+# Provider registry for easy lookup by name
+PROVIDERS = _ProviderRegistry({
+    "claude": "ClaudeProvider",
+    "codex": "CodexProvider",
+    "gemini": "GeminiProvider",
+    "qwen": "QwenProvider",
+    "ollama": "OllamaProvider",
+    "openrouter": "OpenRouterProvider",
+    "glm": "GLMProvider",
+})
+
+
 def get_provider(name: str) -> type[BaseProvider]:
     """Get provider class by name."""
-    if name not in PROVIDERS:
-        raise ValueError(f"Unknown provider: {name}")
-    return PROVIDERS[name]
+    try:
+        return PROVIDERS[name]  # single registry probe; imports only this provider
+    except KeyError:
+        raise ValueError(f"Unknown provider: {name}") from None
 
 
 def get_provider_instance(name: str) -> BaseProvider:
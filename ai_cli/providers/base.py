@@ -1,10 +1,26 @@
 """Base provider protocol and shared utilities."""
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Protocol, runtime_checkable
+from typing import Protocol
+
+
+@functools.cache
+def https_context():
+    """Shared TLS context for HTTP providers (CA certificates are loaded once per process)."""
+    import ssl
+    return ssl.create_default_context()
+
+
+@functools.lru_cache(maxsize=128)
+def split_effort(model: str) -> tuple[str, str | None]:
+    """Split a "model@effort" string into (model, effort); effort is None if absent."""
+    if "@" not in model:
+        return model, None
+    model, effort = model.rsplit("@", 1)
+    return model, effort
 
 
-@runtime_checkable
 class Provider(Protocol):
     """Protocol defining the interface all providers must implement."""
 
@@ -1,6 +1,6 @@
 """Claude CLI provider (Anthropic)."""
 
-from .cli import CLIConfig, CLIProvider
+from .cli import CLIConfig, CLIProvider, MODEL_ARGS, OUTPUT_FORMAT_JSON_ARGS
 
 
 class ClaudeProvider(CLIProvider):
@@ -9,22 +9,13 @@ class ClaudeProvider(CLIProvider):
     name = "claude"
     cli_name = "claude"
     config = CLIConfig(
-        base_cmd=["claude", "--print"],
-        model_args=["--model"],
-        json_args=["--output-format", "json"],
-        yolo_args=["--dangerously-skip-permissions"],
+        base_cmd=("claude", "--print"),
+        model_args=MODEL_ARGS,
+        json_args=OUTPUT_FORMAT_JSON_ARGS,
+        yolo_args=("--dangerously-skip-permissions",),
         prompt_mode="arg",
+        effort_args=("--effort", "{effort}"),
     )
 
     # Known models for this provider
     KNOWN_MODELS = ["haiku", "sonnet", "opus"]
-
-    def _build_command(self, model: str, prompt: str, json_output: bool, yolo: bool) -> list[str]:
-        """Build command, extracting @effort suffix if present."""
-        effort = None
-        if "@" in model:
-            model, effort = model.rsplit("@", 1)
-        cmd = super()._build_command(model, prompt, json_output, yolo)
-        if effort:
-            cmd.extend(["--effort", effort])
-        return cmd
@@ -1,27 +1,73 @@
 """Base class for CLI-based providers (subprocess execution)."""
 
+import functools
+import locale
 import shutil
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from .base import BaseProvider
+from .base import BaseProvider, split_effort
 from ..constants import EXECUTION_TIMEOUT
 from ..exceptions import ProviderError
 
 
-@dataclass
+@functools.lru_cache(maxsize=32)
+def cached_which(name: str) -> str | None:
+    """shutil.which with per-process memoization (use cached_which.cache_clear() to rescan PATH)."""
+    return shutil.which(name)
+
+
+# Argument tuples shared by several providers' configs
+MODEL_ARGS = ("--model",)
+OUTPUT_FORMAT_JSON_ARGS = ("--output-format", "json")
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured subprocess output the way text=True would, but never raise.
+
+    Uses the locale encoding and translates CRLF and lone CR to LF
+    (universal newlines); undecodable bytes are replaced.
+    """
+    text = data.decode(locale.getpreferredencoding(False), "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+@dataclass(frozen=True, slots=True)
 class CLIConfig:
-    """Configuration for a CLI-based provider."""
+    """Configuration for a CLI-based provider (immutable)."""
 
-    base_cmd: list[str]
-    model_args: list[str]
-    json_args: list[str]
-    yolo_args: list[str]
+    base_cmd: tuple[str, ...]
+    model_args: tuple[str, ...]
+    json_args: tuple[str, ...]
+    yolo_args: tuple[str, ...]
     prompt_mode: str  # "stdin" or "arg"
-    extra_args: list[str] | None = None
+    extra_args: tuple[str, ...] | None = None
     model_positional: bool = False  # model comes after flags, before prompt
     timeout: int | None = None  # Override default timeout
-    default_args: list[str] | None = None  # Args passed when NOT in yolo mode
+    default_args: tuple[str, ...] | None = None  # Args passed when NOT in yolo mode
+    effort_args: tuple[str, ...] | None = None  # Args for a "model@effort" suffix; "{effort}" is substituted
+
+    # Precomputed command parts (see __post_init__)
+    _head: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _tails: dict[tuple[bool, bool], tuple[str, ...]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the fixed parts of the command once per config."""
+        # Everything up to the model: base command + model flag
+        object.__setattr__(self, "_head", self.base_cmd + self.model_args)
+        # Everything after the model, for each (json_output, yolo) combination
+        tails = {}
+        for json_output in (False, True):
+            for yolo in (False, True):
+                mode_args = self.yolo_args if yolo and self.yolo_args else self.default_args
+                tails[json_output, yolo] = (
+                    (self.json_args if json_output else ())
+                    + (mode_args or ())
+                    + (self.extra_args or ())
+                )
+        object.__setattr__(self, "_tails", tails)
 
 
 class CLIProvider(BaseProvider):
@@ -33,7 +79,7 @@ class CLIProvider(BaseProvider):
 
     def is_available(self) -> bool:
         """Check if the CLI tool is installed."""
-        return shutil.which(self.cli_name) is not None
+        return cached_which(self.cli_name) is not None
 
     def call(
         self,
@@ -57,23 +103,30 @@ class CLIProvider(BaseProvider):
         import os
         env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
 
+        # performance: never pass preexec_fn/start_new_session, so CPython can launch via
+        # vfork (no page-table copy of this process); the PATH lookup is already cached.
+        executable = cached_which(cmd[0])
+
+        # Capture raw bytes: only the stream we actually use gets decoded
         try:
             if self.config.prompt_mode == "stdin":
                 result = subprocess.run(
-                    cmd, input=prompt, capture_output=True, text=True, timeout=call_timeout, env=env
+                    cmd, executable=executable, input=prompt.encode(locale.getpreferredencoding(False)), capture_output=True,
+                    timeout=call_timeout, env=env,
                 )
             else:
                 cmd.append(prompt)
                 result = subprocess.run(
-                    cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL, timeout=call_timeout, env=env
+                    cmd, executable=executable, capture_output=True, stdin=subprocess.DEVNULL,
+                    timeout=call_timeout, env=env,
                 )
         except subprocess.TimeoutExpired:
             raise ProviderError(self.name, f"Command timed out after {call_timeout}s")
 
         if result.returncode != 0:
-            raise ProviderError(self.name, result.stderr.strip())
+            raise ProviderError(self.name, _decode_output(result.stderr).strip())
 
-        return result.stdout
+        return _decode_output(result.stdout)
 
     def _build_command(
         self,
@@ -84,25 +137,22 @@ class CLIProvider(BaseProvider):
     ) -> list[str]:
         """Build the command list for subprocess execution."""
         cfg = self.config
-        cmd = list(cfg.base_cmd)
-
-        if cfg.model_args:
-            cmd.extend(cfg.model_args)
-            cmd.append(model)
 
-        if json_output and cfg.json_args:
-            cmd.extend(cfg.json_args)
+        # Extract "@effort" suffix (e.g. "opus@high") for providers that support it
+        effort = None
+        if cfg.effort_args:
+            model, effort = split_effort(model)
 
-        if yolo and cfg.yolo_args:
-            cmd.extend(cfg.yolo_args)
-        elif cfg.default_args:
-            cmd.extend(cfg.default_args)
-
-        if cfg.extra_args:
-            cmd.extend(cfg.extra_args)
+        if cfg.model_args:
+            cmd = [*cfg._head, model, *cfg._tails[bool(json_output), bool(yolo)]]
+        else:
+            cmd = [*cfg._head, *cfg._tails[bool(json_output), bool(yolo)]]
 
         # Some providers (e.g., ollama) need model as positional arg after flags
         if cfg.model_positional:
             cmd.append(model)
 
+        if effort:
+            cmd.extend(arg.format(effort=effort) for arg in cfg.effort_args)
+
         return cmd
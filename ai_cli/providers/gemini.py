@@ -1,6 +1,6 @@
 """Gemini CLI provider (Google)."""
 
-from .cli import CLIConfig, CLIProvider
+from .cli import CLIConfig, CLIProvider, MODEL_ARGS, OUTPUT_FORMAT_JSON_ARGS
 
 
 class GeminiProvider(CLIProvider):
@@ -9,15 +9,15 @@ class GeminiProvider(CLIProvider):
     name = "gemini"
     cli_name = "gemini"
     config = CLIConfig(
-        base_cmd=["gemini"],
-        model_args=["--model"],
-        json_args=["--output-format", "json"],
-        yolo_args=["--yolo"],
+        base_cmd=("gemini",),
+        model_args=MODEL_ARGS,
+        json_args=OUTPUT_FORMAT_JSON_ARGS,
+        yolo_args=("--yolo",),
         prompt_mode="arg",
-        default_args=[
+        default_args=(
             "--allowed-tools", "run_shell_command", "read_file",
             "list_directory", "search_file_content", "glob",
-        ],
+        ),
     )
 
     KNOWN_MODELS = [
@@ -1,13 +1,13 @@
 """GLM API provider (Zhipu AI / Z.ai) - HTTP-based."""
 
-import json
 import os
 import urllib.error
 import urllib.request
 
-from .base import BaseProvider
+from .base import BaseProvider, https_context
 from ..constants import EXECUTION_TIMEOUT
 from ..exceptions import ProviderError
+from ..fastjson import dumps, loads
 
 
 class GLMProvider(BaseProvider):
@@ -65,7 +65,7 @@ class GLMProvider(BaseProvider):
 
         req = urllib.request.Request(
             self.API_URL,
-            data=json.dumps(payload).encode(),
+            data=dumps(payload),  # bytes in one pass (orjson when available)
             headers={
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
@@ -73,8 +73,9 @@ class GLMProvider(BaseProvider):
         )
 
         try:
-            with urllib.request.urlopen(req, timeout=EXECUTION_TIMEOUT) as resp:
-                data = json.loads(resp.read().decode())
+            with urllib.request.urlopen(req, timeout=EXECUTION_TIMEOUT, context=https_context()) as resp:
+                # Parse the raw bytes in one pass (orjson when available)
+                data = loads(resp.read())
 
                 # Validate response structure
                 if "error" in data:
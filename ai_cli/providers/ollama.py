@@ -1,7 +1,12 @@
 """Ollama provider (local models)."""
 
+import re
 import subprocess
 from .cli import CLIConfig, CLIProvider
+from ..constants import RESERVED_COMMANDS
+
+# First column (model NAME) of each `ollama list` row
+_MODEL_NAME_RE = re.compile(r"^[ \t]*(\S+)", re.MULTILINE)
 
 
 class OllamaProvider(CLIProvider):
@@ -10,12 +15,12 @@ class OllamaProvider(CLIProvider):
     name = "ollama"
     cli_name = "ollama"
     config = CLIConfig(
-        base_cmd=["ollama", "run"],
-        model_args=[],  # model is positional
-        json_args=["--format", "json"],
-        yolo_args=[],  # ollama doesn't need yolo
+        base_cmd=("ollama", "run"),
+        model_args=(),  # model is positional
+        json_args=("--format", "json"),
+        yolo_args=(),  # ollama doesn't need yolo
         prompt_mode="arg",
-        extra_args=["--hidethinking"],
+        extra_args=("--hidethinking",),
         model_positional=True,
     )
 
@@ -32,20 +37,14 @@ class OllamaProvider(CLIProvider):
             if result.returncode != 0:
                 return []
             # Parse output: NAME ID SIZE MODIFIED
-            models = []
-            for line in result.stdout.strip().split("\n")[1:]:  # Skip header
-                if line.strip():
-                    name = line.split()[0]
-                    models.append(name)
-            return models
+            _, _, rows = result.stdout.partition("\n")  # Skip header
+            return _MODEL_NAME_RE.findall(rows)
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return []
 
     @classmethod
     def generate_aliases(cls, models: list[str], existing: dict) -> dict:
         """Generate short aliases for Ollama models."""
-        from ..constants import RESERVED_COMMANDS
-
         aliases = {}
         if not models:
             return aliases
@@ -53,9 +52,10 @@ class OllamaProvider(CLIProvider):
         # Set default ollama alias to first model
         aliases["ollama"] = ("ollama", models[0])
 
+        blocked = RESERVED_COMMANDS | existing.keys()
         for model in models:
-            short_name = model.split(":")[0]  # llama3:latest -> llama3
-            if short_name not in existing and short_name not in RESERVED_COMMANDS:
+            short_name = model.partition(":")[0]  # llama3:latest -> llama3
+            if short_name not in blocked:
                 aliases[short_name] = ("ollama", model)
 
         return aliases
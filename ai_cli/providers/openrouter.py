@@ -1,14 +1,131 @@
 """OpenRouter API provider (HTTP-based)."""
 
-import json
+import functools
 import os
 import re
-import urllib.error
-import urllib.request
+import threading
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable
 
-from .base import BaseProvider
-from ..constants import EXECUTION_TIMEOUT
+from .base import BaseProvider, https_context
+from ..constants import CONNECT_TIMEOUT, EXECUTION_TIMEOUT
 from ..exceptions import ProviderError
+from ..fastjson import JSONDecodeError, dumps, loads
+
+# http.client, urllib and hashlib are imported where requests are made:
+# availability checks and alias generation import this module without them
+if TYPE_CHECKING:
+    import http.client
+
+# Optional: ijson streams the models listing off the socket instead of
+# building the whole response tree just to pick out the ids
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# One keep-alive connection per (thread, host): repeated calls skip TCP + TLS setup
+_local = threading.local()
+
+# Free model ids keyed by a digest of the API key (never the key itself) ->
+# (monotonic expiry, ids). Only successful fetches are cached.
+_FREE_MODELS_CACHE: dict[bytes, tuple[float, tuple[str, ...]]] = {}
+FREE_MODELS_TTL = 300.0
+
+
+def _new_connection(netloc: str) -> "http.client.HTTPSConnection":
+    """Create an HTTPS connection to netloc, tunnelled through the https proxy (if any).
+
+    Proxy settings come from urllib's getproxies()/proxy_bypass(), so
+    HTTPS_PROXY and NO_PROXY apply exactly as they do for urlopen-based providers.
+    """
+    import base64
+    import http.client
+    import urllib.request
+    from urllib.parse import unquote, urlsplit
+
+    target = urlsplit(f"//{netloc}")
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(target.hostname):
+        return http.client.HTTPSConnection(netloc, context=https_context())
+
+    proxy_parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    tunnel_headers = {}
+    if proxy_parts.username:
+        credentials = f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+        tunnel_headers["Proxy-Authorization"] = f"Basic {base64.b64encode(credentials.encode()).decode()}"
+    conn = http.client.HTTPSConnection(
+        proxy_parts.hostname,
+        proxy_parts.port or (443 if proxy_parts.scheme == "https" else 80),
+        context=https_context(),
+    )
+    conn.set_tunnel(target.hostname, target.port, headers=tunnel_headers)
+    return conn
+
+
+def _request(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    body: bytes | None = None,
+    timeout: float = EXECUTION_TIMEOUT,
+    connect_timeout: float = CONNECT_TIMEOUT,
+    retry: bool = True,
+    parse: Callable[["http.client.HTTPResponse"], Any] | None = None,
+) -> tuple[int, Any]:
+    """Send an HTTPS request over this thread's persistent connection; returns (status, body).
+
+    Connecting (TCP + TLS) is bounded by connect_timeout, so an unreachable host
+    fails fast; timeout applies to each read once connected. If parse is given,
+    a 200 response is handed to it to consume incrementally and its return value
+    replaces the body bytes. If a reused connection turns out to have been
+    closed by the server while idle, it is replaced and the request retried
+    once, but only when the server cannot have acted on it: sending failed, or
+    the request was a GET. A POST whose response was lost is never resent.
+    Network failures raise OSError or http.client.HTTPException.
+    """
+    import http.client
+    from urllib.parse import urlsplit
+
+    parts = urlsplit(url)
+    conns = _local.__dict__.setdefault("conns", {})
+    conn = conns.get(parts.netloc)
+    reused = conn is not None and conn.sock is not None
+    if conn is None:
+        conn = conns[parts.netloc] = _new_connection(parts.netloc)
+
+    sent = False
+    try:
+        if conn.sock is None:
+            conn.timeout = connect_timeout
+            conn.connect()
+        conn.sock.settimeout(timeout)
+        conn.request(method, parts.path, body=body, headers=headers)
+        sent = True
+        resp = conn.getresponse()
+        if parse is not None and resp.status == 200:
+            result = parse(resp)
+            resp.read()  # drain whatever the parser left so the socket can be reused
+            return resp.status, result
+        return resp.status, resp.read()  # drain fully so the socket can be reused
+    except BaseException as e:
+        conn.close()
+        del conns[parts.netloc]
+        stale = isinstance(e, (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError))
+        if stale and reused and retry and (not sent or method == "GET"):
+            return _request(method, url, headers, body, timeout, connect_timeout, retry=False, parse=parse)
+        raise
+
+
+def _stream_free_ids(resp: "http.client.HTTPResponse") -> list[str]:
+    """Collect ':free' model ids from a models listing as it streams in (requires ijson)."""
+    return [model_id for model_id in ijson.items(resp, "data.item.id") if model_id.endswith(":free")]
+
+
+def clear_free_models_cache() -> None:
+    """Drop cached free model lists so the next get_free_models() refetches."""
+    _FREE_MODELS_CACHE.clear()
 
 
 class OpenRouterProvider(BaseProvider):
@@ -19,12 +136,17 @@ class OpenRouterProvider(BaseProvider):
     MODELS_URL = "https://openrouter.ai/api/v1/models"
 
     def __init__(self, api_key: str | None = None):
-        self._api_key = api_key
+        self._explicit_api_key = api_key
+        self.api_key: str | None = None
+        self.refresh_api_key()
+
+    def refresh_api_key(self) -> None:
+        """Resolve the API key from the init param or environment.
 
-    @property
-    def api_key(self) -> str | None:
-        """Get API key from init param or environment."""
-        return self._api_key or os.getenv("OPENROUTER_API_KEY")
+        Done once per instance rather than on every call; call this again to
+        pick up a changed OPENROUTER_API_KEY.
+        """
+        self.api_key = self._explicit_api_key or os.getenv("OPENROUTER_API_KEY")
 
     def is_available(self) -> bool:
         """Check if API key is set."""
@@ -55,57 +177,76 @@ class OpenRouterProvider(BaseProvider):
         if json_output:
             payload["response_format"] = {"type": "json_object"}
 
-        req = urllib.request.Request(
-            self.API_URL,
-            data=json.dumps(payload).encode(),
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            },
-        )
+        import http.client
 
         try:
-            with urllib.request.urlopen(req, timeout=EXECUTION_TIMEOUT) as resp:
-                data = json.loads(resp.read().decode())
+            status, body = _request(
+                "POST",
+                self.API_URL,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                body=dumps(payload),
+            )
+        except (OSError, http.client.HTTPException) as e:
+            raise ProviderError(self.name, f"Connection error: {e}")
+
+        if status >= 400:
+            raise ProviderError(self.name, f"HTTP {status}: {body.decode(errors='replace')}")
 
-                # Validate response structure
-                if "error" in data:
-                    raise ProviderError(self.name, data["error"].get("message", str(data["error"])))
+        data = loads(body)
 
-                choices = data.get("choices")
-                if not choices or not isinstance(choices, list):
-                    raise ProviderError(self.name, "Invalid response: missing 'choices'")
+        # Validate response structure
+        if "error" in data:
+            raise ProviderError(self.name, data["error"].get("message", str(data["error"])))
 
-                message = choices[0].get("message", {})
-                content = message.get("content")
-                if content is None:
-                    raise ProviderError(self.name, "Invalid response: missing 'content'")
+        choices = data.get("choices")
+        if not choices or not isinstance(choices, list):
+            raise ProviderError(self.name, "Invalid response: missing 'choices'")
 
-                return content
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if e.fp else str(e)
-            raise ProviderError(self.name, f"HTTP {e.code}: {error_body}")
-        except urllib.error.URLError as e:
-            raise ProviderError(self.name, f"Connection error: {e.reason}")
+        message = choices[0].get("message", {})
+        content = message.get("content")
+        if content is None:
+            raise ProviderError(self.name, "Invalid response: missing 'content'")
+
+        return content
 
     @classmethod
     def get_free_models(cls, api_key: str | None = None) -> list[str]:
-        """Fetch free models from OpenRouter API."""
+        """Fetch free models from OpenRouter API (cached per API key for FREE_MODELS_TTL seconds)."""
         key = api_key or os.getenv("OPENROUTER_API_KEY")
         if not key:
             return []
 
+        import hashlib
+        import http.client
+
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        cached = _FREE_MODELS_CACHE.get(digest)
+        if cached is not None and cached[0] > time.monotonic():
+            return list(cached[1])
+
         try:
-            req = urllib.request.Request(
+            status, body = _request(
+                "GET",
                 cls.MODELS_URL,
                 headers={
                     "Authorization": f"Bearer {key}",
-                }
+                },
+                timeout=10,
+                parse=_stream_free_ids if ijson is not None else None,
             )
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                data = json.loads(resp.read().decode())
-                return [m["id"] for m in data.get("data", []) if m["id"].endswith(":free")]
-        except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError, KeyError, TypeError):
+            if status != 200:
+                return []
+            if ijson is not None:
+                ids = body
+            else:
+                data = loads(body)
+                ids = [m["id"] for m in data.get("data", []) if m["id"].endswith(":free")]
+            _FREE_MODELS_CACHE[digest] = (time.monotonic() + FREE_MODELS_TTL, tuple(ids))
+            return ids
+        except (OSError, http.client.HTTPException, JSONDecodeError, KeyError, TypeError):
             # Expected failures: network issues, bad response format
             return []
         except Exception as e:
@@ -114,20 +255,30 @@ class OpenRouterProvider(BaseProvider):
             print(f"Warning: Failed to fetch OpenRouter models: {e}", file=sys.stderr)
             return []
 
+    # Variant words dropped by shorten_name, as one alternation. They only match
+    # whole "-word" tokens ("-pro" but not the start of "-provider"), wherever they
+    # appear: size words often sit mid-name (mistral-small-3.2-24b-instruct).
+    # "-venice-edition" is deliberately absent: "-edition" alone leaves "-venice".
+    _SUFFIX_RE = re.compile("-(?:%s)(?=-|$)" % "|".join([
+        "instruct", "it", "pro", "air", "exp", "mini",
+        "small", "nano", "flash", "plus", "chat", "base",
+        "preview", "edition",
+    ]))
+    # Version patterns, applied in order: each step sees the previous one's output
+    _VERSION_SUBS = (
+        (re.compile(r'-v\d+'), ''),  # -v2, -v3
+        (re.compile(r'-\d+(\.\d+)?b?$'), ''),  # -24b, -3.1, -70b
+        (re.compile(r'-\d+\.\d+-'), '-'),  # -3.1- in middle
+        (re.compile(r'-\d+b-'), '-'),  # -24b- in middle
+    )
+
     @classmethod
+    @functools.lru_cache(maxsize=512)
     def shorten_name(cls, full_name: str) -> str:
         """Shorten an OpenRouter model name by removing common suffixes and versions."""
-        name = full_name
-        # Remove common suffixes
-        for suffix in ["-instruct", "-it", "-pro", "-air", "-exp", "-mini",
-                       "-small", "-nano", "-flash", "-plus", "-chat", "-base",
-                       "-preview", "-edition", "-venice-edition"]:
-            name = name.replace(suffix, "")
-        # Remove version patterns
-        name = re.sub(r'-v\d+', '', name)  # -v2, -v3
-        name = re.sub(r'-\d+(\.\d+)?b?$', '', name)  # -24b, -3.1, -70b
-        name = re.sub(r'-\d+\.\d+-', '-', name)  # -3.1- in middle
-        name = re.sub(r'-\d+b-', '-', name)  # -24b- in middle
+        name = cls._SUFFIX_RE.sub('', full_name)
+        for pattern, repl in cls._VERSION_SUBS:
+            name = pattern.sub(repl, name)
         return name.strip('-') or full_name
 
     @classmethod
@@ -139,32 +290,31 @@ class OpenRouterProvider(BaseProvider):
         if not models:
             return aliases
 
-        # First pass: collect candidates
-        candidates = {}  # short_name -> [models]
-        full_names = {}  # model -> full_name
-
+        # First pass: group (model, full_name) pairs by short name
+        candidates = defaultdict(list)  # short_name -> [(model, full_name)]
         for model in models:
-            if "/" not in model:
+            _, slash, rest = model.partition("/")
+            if not slash:
                 continue
-            full_name = model.split("/")[1].replace(":free", "")
-            full_names[model] = full_name
-            short_name = cls.shorten_name(full_name)
-            candidates.setdefault(short_name, []).append(model)
-
-        # Second pass: assign aliases
-        for short_name, model_list in candidates.items():
-            if len(model_list) == 1:
-                model = model_list[0]
-                full_name = full_names[model]
-                if short_name not in existing and short_name not in RESERVED_COMMANDS:
-                    aliases[short_name] = ("openrouter", model)
-                elif full_name not in existing and full_name not in RESERVED_COMMANDS:
-                    aliases[full_name] = ("openrouter", model)
+            full_name = rest.removesuffix(":free")
+            candidates[cls.shorten_name(full_name)].append((model, full_name))
+
+        # Second pass: assign aliases. Names are blocked once taken, so a later
+        # candidate can't silently overwrite an earlier one.
+        blocked = set(RESERVED_COMMANDS)
+        blocked.update(existing)
+        for short_name, entries in candidates.items():
+            if len(entries) == 1:
+                model, full_name = entries[0]
+                name = short_name if short_name not in blocked else full_name
+                if name not in blocked:
+                    aliases[name] = ("openrouter", model)
+                    blocked.add(name)
             else:
                 # Conflict - use full names
-                for model in model_list:
-                    full_name = full_names[model]
-                    if full_name not in existing and full_name not in RESERVED_COMMANDS:
+                for model, full_name in entries:
+                    if full_name not in blocked:
                         aliases[full_name] = ("openrouter", model)
+                        blocked.add(full_name)
 
         return aliases
@@ -1,6 +1,6 @@
 """Qwen CLI provider (Alibaba)."""
 
-from .cli import CLIConfig, CLIProvider
+from .cli import CLIConfig, CLIProvider, MODEL_ARGS, OUTPUT_FORMAT_JSON_ARGS
 
 
 class QwenProvider(CLIProvider):
@@ -9,10 +9,10 @@ class QwenProvider(CLIProvider):
     name = "qwen"
     cli_name = "qwen"
     config = CLIConfig(
-        base_cmd=["qwen"],
-        model_args=["--model"],
-        json_args=["--output-format", "json"],
-        yolo_args=["--yolo"],
+        base_cmd=("qwen",),
+        model_args=MODEL_ARGS,
+        json_args=OUTPUT_FORMAT_JSON_ARGS,
+        yolo_args=("--yolo",),
         prompt_mode="arg",
     )
 
@@ -1,13 +1,86 @@
 """HTTP server for cross-language access to ai-cli."""
 
-import json
+import functools
 import os
+import queue
 import secrets
-from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import sys
+import threading
+import time
+from http.server import HTTPServer, BaseHTTPRequestHandler
 from typing import Any
 
 from .client import AIClient
 from .exceptions import AIError, ProviderError, UnknownAliasError
+from .fastjson import JSONDecodeError, dumps, loads
+
+
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
+@functools.lru_cache(maxsize=1)
+def _expected_auth_header(token: str) -> bytes:
+    """Full Authorization header value accepted for token, as raw (UTF-8) bytes, built once."""
+    return f"Bearer {token}".encode()
+
+
+class AccessLog:
+    """Access log written by a background thread.
+
+    Handlers only enqueue (timestamp, format, args); formatting and the
+    blocking stdout write happen on one daemon thread, which writes
+    everything queued so far in a single call.
+    """
+
+    def __init__(self):
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def log(self, format: str, *args) -> None:
+        """Queue one log line (cheap; never blocks on I/O)."""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="ai-cli-access-log", daemon=True)
+                    self._thread.start()
+        self._queue.put((time.time(), format, args))
+
+    def close(self) -> None:
+        """Write out pending lines and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while True:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            lines = [
+                f"[{_log_time(ts)}] {format % args}\n"
+                for ts, format, args in filter(None, batch)
+            ]
+            if lines:
+                sys.stdout.write("".join(lines))
+                sys.stdout.flush()
+            if None in batch:
+                return
+
+
+def _log_time(ts: float) -> str:
+    """Format a timestamp like BaseHTTPRequestHandler.log_date_time_string()."""
+    year, month, day, hh, mm, ss, *_ = time.localtime(ts)
+    return "%02d/%3s/%04d %02d:%02d:%02d" % (
+        day, BaseHTTPRequestHandler.monthname[month], year, hh, mm, ss
+    )
+
+
+access_log = AccessLog()
 
 
 class AIHandler(BaseHTTPRequestHandler):
@@ -16,27 +89,65 @@ class AIHandler(BaseHTTPRequestHandler):
     client: AIClient = None  # Set by run_server
     auth_token: str | None = None  # Set by run_server
 
+    # Keep connections open between requests (every response sets Content-Length).
+    # A connection holds a pool worker even while idle, so an idle keep-alive
+    # socket is dropped after KEEPALIVE_TIMEOUT, far sooner than the read
+    # timeout for a request that has started arriving.
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+    KEEPALIVE_TIMEOUT = 2
+
+    MAX_BODY = 8 * 1024 * 1024  # Largest accepted /call body, in bytes
+    READ_CHUNK = 64 * 1024
+
+    # Serialized GET bodies, shared by all handler instances. /models is keyed by
+    # the alias entries it reports (add_alias()/remove_alias() mutate the Config
+    # in place), /providers by the availability list it reports.
+    _models_cache: tuple[tuple[tuple[str, tuple[str, str]], ...], bytes] | None = None
+    _providers_cache: tuple[list[str], bytes] | None = None
+
+    def handle(self) -> None:
+        """Handle requests until the client closes, asks to close, or idles out."""
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and self._await_next_request():
+            self.handle_one_request()
+
+    def _await_next_request(self) -> bool:
+        """Wait up to KEEPALIVE_TIMEOUT for the next request to start arriving."""
+        self.connection.settimeout(self.KEEPALIVE_TIMEOUT)
+        try:
+            if not self.rfile.peek(1):  # buffered (pipelined) bytes return immediately
+                return False
+        except OSError:  # idle timeout (TimeoutError) or the client went away
+            return False
+        self.connection.settimeout(self.timeout)
+        return True
+
+    def _release_if_saturated(self) -> bool:
+        """Mark the connection for closing if other connections are waiting for a worker.
+
+        Returns whether the connection closes after this response.
+        """
+        if self.server.saturated():
+            self.close_connection = True
+        return bool(self.close_connection)
+
     def do_GET(self) -> None:
         """Handle GET requests."""
         if self.path == "/health":
-            self._send_json({"status": "ok"})
+            # Hottest endpoint (liveness probes): one write with a prebuilt tail,
+            # and probes are not access-logged
+            tail = _HEALTH_TAIL_CLOSE if self._release_if_saturated() else _HEALTH_TAIL
+            self.wfile.write(self._head_start(200) + tail)
         elif self.path == "/models":
             if not self._check_auth():
                 return
-            models = self.client.list_models()
-            self._send_json({
-                "models": {
-                    alias: {"provider": p, "model": m}
-                    for alias, (p, m) in models.items()
-                }
-            })
+            self._send_body(self._models_body())
         elif self.path == "/providers":
             if not self._check_auth():
                 return
-            self._send_json({
-                "providers": self.client.list_providers(),
-                "available": self.client.list_available_providers(),
-            })
+            self._send_body(self._providers_body())
         else:
             self._send_error(404, "Not found")
 
@@ -54,11 +165,11 @@ class AIHandler(BaseHTTPRequestHandler):
         if self.auth_token is None:
             return True  # No auth configured
 
-        auth_header = self.headers.get("Authorization", "")
-        if auth_header.startswith("Bearer "):
-            token = auth_header[7:]
-            if secrets.compare_digest(token, self.auth_token):
-                return True
+        # Header values are latin-1 decoded, so encoding back recovers the raw bytes;
+        # comparing bytes also keeps compare_digest from raising on non-ASCII input
+        auth_header = self.headers.get("Authorization", "").encode("latin-1")
+        if secrets.compare_digest(auth_header, _expected_auth_header(self.auth_token)):
+            return True
 
         self._send_error(401, "Unauthorized: invalid or missing Bearer token")
         return False
@@ -67,8 +178,13 @@ class AIHandler(BaseHTTPRequestHandler):
         """Handle /call endpoint."""
         try:
             content_length = int(self.headers.get("Content-Length", 0))
-            body = self.rfile.read(content_length).decode()
-            data = json.loads(body)
+            if content_length < 0:
+                self._send_error(400, "Invalid Content-Length")
+                return
+            if content_length > self.MAX_BODY:
+                self._send_error(413, f"Request body too large (limit {self.MAX_BODY} bytes)")
+                return
+            data = loads(self._read_body(content_length))  # parsed from bytes, no str copy
 
             alias = data.get("alias")
             prompt = data.get("prompt")
@@ -83,7 +199,7 @@ class AIHandler(BaseHTTPRequestHandler):
             result = self.client.call(alias, prompt, json_mode=json_mode, yolo=yolo)
             self._send_json({"result": result})
 
-        except json.JSONDecodeError as e:
+        except (JSONDecodeError, UnicodeDecodeError) as e:  # stdlib json raises the latter for bad UTF-8
             self._send_error(400, f"Invalid JSON: {e}")
         except UnknownAliasError as e:
             self._send_error(404, e.message)  # Unknown alias = not found
@@ -94,22 +210,162 @@ class AIHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self._send_error(500, str(e))  # Unexpected server error
 
+    def _read_body(self, length: int) -> bytearray:
+        """Read up to length body bytes in READ_CHUNK pieces.
+
+        Memory grows with the bytes actually received rather than being
+        reserved up front from the client-supplied Content-Length.
+        """
+        body = bytearray()
+        while len(body) < length:
+            chunk = self.rfile.read(min(self.READ_CHUNK, length - len(body)))
+            if not chunk:
+                break  # client went away mid-body
+            body += chunk
+        return body
+
+    def _models_body(self) -> bytes:
+        """Get the /models response body, re-encoding only when the config changed."""
+        aliases = tuple(self.client.config.aliases.items())
+        cached = AIHandler._models_cache
+        if cached is None or cached[0] != aliases:
+            cached = AIHandler._models_cache = (aliases, dumps({
+                "models": {
+                    alias: {"provider": p, "model": m}
+                    for alias, (p, m) in aliases
+                }
+            }))
+        return cached[1]
+
+    def _providers_body(self) -> bytes:
+        """Get the /providers response body, re-encoding only when availability changed."""
+        available = self.client.list_available_providers()
+        cached = AIHandler._providers_cache
+        if cached is None or cached[0] != available:
+            cached = AIHandler._providers_cache = (available, dumps({
+                "providers": self.client.list_providers(),
+                "available": available,
+            }))
+        return cached[1]
+
     def _send_json(self, data: dict[str, Any], status: int = 200) -> None:
         """Send JSON response."""
-        body = json.dumps(data).encode()
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+        self._send_body(dumps(data), status)
+
+    def _send_body(self, body: bytes, status: int = 200) -> None:
+        """Send an already-encoded JSON response body.
+
+        Status line, headers and body go out in one write instead of the
+        separate header and body writes of send_response()/end_headers().
+        """
+        self.log_request(status)
+        connection = b"Connection: close\r\n" if self._release_if_saturated() else b""
+        head = b"%sContent-Length: %d\r\n%s\r\n" % (self._head_start(status), len(body), connection)
+        self.wfile.write(head + body)
+
+    def _head_start(self, status: int) -> bytes:
+        """Status line and the headers shared by every response: Server, Content-Type and Date."""
+        prefix = _response_prefix(self.protocol_version, status, self.version_string())
+        return b"%sDate: %s\r\n" % (prefix, self.date_time_string().encode())
 
     def _send_error(self, status: int, message: str) -> None:
-        """Send error response."""
+        """Send error response and close the connection.
+
+        Errors can be sent before the request body is read (e.g. 401 on
+        POST /call), so the stream can't be trusted for another request.
+        """
+        self.close_connection = True
         self._send_json({"error": message}, status)
 
     def log_message(self, format: str, *args) -> None:
-        """Log HTTP requests."""
-        print(f"[{self.log_date_time_string()}] {format % args}")
+        """Log HTTP requests (via the background access log)."""
+        access_log.log(format, *args)
+
+
+@functools.lru_cache(maxsize=64)
+def _response_prefix(protocol: str, status: int, server: str) -> bytes:
+    """Encoded status line, Server and Content-Type headers for a JSON response.
+
+    Cached per (protocol, status, server): only a handful of statuses are ever
+    sent, whereas Date and the body length differ on almost every response.
+    """
+    return (
+        f"{protocol} {status} {BaseHTTPRequestHandler.responses[status][0]}\r\n"
+        f"Server: {server}\r\n"
+        "Content-Type: application/json\r\n"
+    ).encode()
+
+
+# /health response tails (Content-Length, Connection and body), built once
+_HEALTH_TAIL = b"Content-Length: %d\r\n\r\n%s" % (len(_HEALTH_BODY), _HEALTH_BODY)
+_HEALTH_TAIL_CLOSE = b"Content-Length: %d\r\nConnection: close\r\n\r\n%s" % (len(_HEALTH_BODY), _HEALTH_BODY)
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that handles connections on a fixed-size pool of daemon threads.
+
+    ThreadingHTTPServer starts one thread per connection, so a burst of slow
+    /call requests can grow threads without bound. Here excess connections
+    wait in a queue instead. Workers are daemon threads, as ThreadingHTTPServer's
+    are, so shutting down never waits on open connections or running calls.
+    """
+
+    def __init__(self, server_address, handler_class, max_workers: int = 64):
+        super().__init__(server_address, handler_class)
+        self._max_workers = max_workers
+        self._workers: list[threading.Thread] = []
+        # (request, client_address) waiting for a worker; None tells a worker to exit
+        self._pending: queue.SimpleQueue = queue.SimpleQueue()
+
+    def process_request(self, request, client_address) -> None:
+        """Queue the connection for the worker pool, starting workers up to max_workers."""
+        if len(self._workers) < self._max_workers:
+            worker = threading.Thread(
+                target=self._worker, name=f"ai-cli-server-{len(self._workers)}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+        self._pending.put((request, client_address))
+
+    def saturated(self) -> bool:
+        """True when connections are queued waiting for a free worker."""
+        return not self._pending.empty()
+
+    def _worker(self) -> None:
+        """Handle queued connections until told to stop."""
+        while (item := self._pending.get()) is not None:
+            self._process_request_worker(*item)
+
+    def _process_request_worker(self, request, client_address) -> None:
+        """Handle one connection on a pool thread (same as ThreadingMixIn.process_request_thread)."""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def handle_error(self, request, client_address) -> None:
+        """Report handler errors, except clients dropping (idle) keep-alive connections."""
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+    def server_close(self) -> None:
+        """Stop listening, drop connections that have not started yet, and release idle workers.
+
+        Busy workers are daemon threads and are not waited for.
+        """
+        super().server_close()
+        while True:
+            try:
+                item = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self.shutdown_request(item[0])
+        for _ in self._workers:
+            self._pending.put(None)
 
 
 def run_server(
@@ -117,6 +373,7 @@ def run_server(
     host: str = "127.0.0.1",
     token: str | None = None,
     no_auth: bool = False,
+    max_workers: int = 64,
 ) -> None:
     """
     Start the HTTP server.
@@ -126,6 +383,7 @@ def run_server(
         host: Host to bind to (default: 127.0.0.1)
         token: Auth token for Bearer authentication. If None, auto-generates one.
         no_auth: If True, disable authentication (not recommended)
+        max_workers: Maximum number of connections handled concurrently (default: 64)
     """
     # Initialize shared client
     AIHandler.client = AIClient()
@@ -139,7 +397,7 @@ def run_server(
         AIHandler.auth_token = token or os.getenv("AI_CLI_SERVER_TOKEN") or secrets.token_urlsafe(32)
 
     server_address = (host, port)
-    httpd = ThreadingHTTPServer(server_address, AIHandler)
+    httpd = PooledHTTPServer(server_address, AIHandler, max_workers=max_workers)
 
     print(f"ai-cli server starting on http://{host}:{port}")
     print("Endpoints:")
@@ -150,7 +408,6 @@ def run_server(
 
     if AIHandler.auth_token:
         # Print to stderr to avoid log capture, and show how to use
-        import sys
         print(f"\nAuth token: {AIHandler.auth_token}", file=sys.stderr)
         print("Use: Authorization: Bearer <token>", file=sys.stderr)
 
@@ -161,3 +418,5 @@ def run_server(
     except KeyboardInterrupt:
         print("\nShutting down...")
         httpd.shutdown()
+        httpd.server_close()
+        access_log.close()
@@ -1,6 +1,9 @@
 """Unit tests for chat mode functionality."""
 
 import json
+import os
+import shutil
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -197,6 +200,33 @@ class TestChatSessionPersistence(unittest.TestCase):
         self.assertEqual(loaded.messages[0].content, "Hello")
         self.assertEqual(loaded.messages[1].content, "Hi there")
 
+    def test_load_returns_independent_copies(self):
+        """Test that repeated loads don't share message lists or objects."""
+        session = ChatSession(chat_id=self.chat_id, model_alias=self.model_alias)
+        session.add_message("user", "Hello")
+        session.save()
+
+        first = ChatSession.load(self.chat_id)
+        first.messages[0].content = "changed"
+        first.messages.append(Message(role="user", content="extra"))
+
+        second = ChatSession.load(self.chat_id)
+        self.assertEqual(len(second.messages), 1)
+        self.assertEqual(second.messages[0].content, "Hello")
+
+    def test_load_sees_external_changes(self):
+        """Test that a file rewritten outside ChatSession.save is re-read."""
+        session = ChatSession(chat_id=self.chat_id, model_alias=self.model_alias)
+        session.save()
+        self.assertEqual(ChatSession.load(self.chat_id).model_alias, self.model_alias)
+
+        data = session.to_dict()
+        data["model_alias"] = "haiku-renamed"
+        with open(session.path, "w") as f:
+            json.dump(data, f)
+
+        self.assertEqual(ChatSession.load(self.chat_id).model_alias, "haiku-renamed")
+
     def test_load_nonexistent_session(self):
         """Test loading a session that doesn't exist returns None."""
         loaded = ChatSession.load("NONEXISTENT")
@@ -389,7 +419,6 @@ class TestChatManager(unittest.TestCase):
         session1 = ChatManager.create("sonnet", chat_id="TST1")
         session1.save()
         # Small delay to ensure different timestamps
-        import time
         time.sleep(0.01)
         session2 = ChatManager.create("opus", chat_id="TST2")
         session2.save()
@@ -403,7 +432,6 @@ class TestChatManager(unittest.TestCase):
     def test_get_latest_returns_none_when_empty(self):
         """Test that get_latest returns None when no sessions exist."""
         # Get all existing sessions to restore later
-        import shutil
         chats_dir = CONFIG_DIR / "chats"
         chats_dir.mkdir(parents=True, exist_ok=True)
 
@@ -441,6 +469,20 @@ class TestChatManager(unittest.TestCase):
         # Clean up
         session.path.unlink(missing_ok=True)
 
+    def test_get_latest_skips_corrupt_newest_file(self):
+        """Test that get_latest falls back to the next file when the newest is corrupt."""
+        session = ChatManager.create("sonnet", chat_id="TSTOK")
+        session.save()
+        corrupt = CONFIG_DIR / "chats" / "TSTBAD.json"
+        corrupt.write_text("{not json")
+        future = time.time() + 3600  # newer than anything else in the chats dir
+        os.utime(session.path, (future, future))
+        os.utime(corrupt, (future + 1, future + 1))
+
+        latest = ChatManager.get_latest()
+        self.assertIsNotNone(latest)
+        self.assertEqual(latest.chat_id, "TSTOK")
+
 
 class TestChatEdgeCases(unittest.TestCase):
     """Test edge cases and error conditions."""
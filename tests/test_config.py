@@ -0,0 +1,106 @@
+"""Unit tests for config loading and caching."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ai_cli.config import Config, clear_config_cache, load_config
+from ai_cli.exceptions import ConfigError
+
+
+class TestLoadConfigCache(unittest.TestCase):
+    """Test cases for the mtime-keyed load_config cache."""
+
+    def setUp(self):
+        """Create a temporary config file."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "config.json"
+        self._write({"sonnet": ["claude", "sonnet"]}, mtime_ns=1_000_000_000)
+        clear_config_cache()
+
+    def tearDown(self):
+        """Remove the temporary config file and cache entries."""
+        clear_config_cache()
+        self.tmpdir.cleanup()
+
+    def _write(self, aliases: dict, mtime_ns: int) -> None:
+        self.path.write_text(json.dumps({"aliases": aliases}))
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_missing_file_returns_defaults(self):
+        """Test that a missing file yields a default Config bound to that path."""
+        missing = Path(self.tmpdir.name) / "missing.json"
+        config = load_config(missing)
+        self.assertIsInstance(config, Config)
+        self.assertEqual(config.path, missing)
+
+    def test_instances_do_not_share_state(self):
+        """Test that mutating one loaded Config does not leak into the next load."""
+        first = load_config(self.path)
+        first.add_alias("extra", "claude", "opus")
+        second = load_config(self.path)
+        self.assertNotIn("extra", second.aliases)
+        self.assertEqual(second.aliases["sonnet"], ("claude", "sonnet"))
+
+    def test_reloads_when_file_changes(self):
+        """Test that a modified file is re-parsed."""
+        self.assertIn("sonnet", load_config(self.path).aliases)
+        self._write({"opus": ["claude", "opus"]}, mtime_ns=2_000_000_000)
+        config = load_config(self.path)
+        self.assertIn("opus", config.aliases)
+        self.assertNotIn("sonnet", config.aliases)
+
+    def test_reloads_when_rewrite_keeps_mtime_and_size(self):
+        """Test that a same-size rewrite with its mtime restored is still re-parsed."""
+        self.assertIn("sonnet", load_config(self.path).aliases)
+        self._write({"opus-x": ["claude", "sonnet"]}, mtime_ns=1_000_000_000)
+        config = load_config(self.path)
+        self.assertIn("opus-x", config.aliases)
+        self.assertNotIn("sonnet", config.aliases)
+
+    def test_malformed_alias_raises_config_error(self):
+        """Test that a hand-edited bad alias value is reported by name."""
+        for value in (["claude"], "claude:sonnet", ["claude", "sonnet", "extra"], [1, 2]):
+            with self.subTest(value=value):
+                clear_config_cache()
+                self._write({"broken": value}, mtime_ns=3_000_000_000)
+                with self.assertRaisesRegex(ConfigError, "broken"):
+                    load_config(self.path)
+
+    def test_save_is_visible_when_file_stamp_unchanged(self):
+        """Test that saves are tracked even if the rewrite leaves the file stamp as it was.
+
+        Simulates a coarse-mtime filesystem where a same-size rewrite within one
+        tick is indistinguishable from the loaded file ("gpt" <-> "glm").
+        """
+        self.path.write_text(json.dumps({"aliases": {"gpt": ["codex", "gpt"], "glm": ["glm", "glm"]},
+                                         "default_alias": "gpt"}))
+        with patch("ai_cli.config._file_stamp", return_value=(1, 1, 1, 1)):
+            config = load_config(self.path)
+            config.set_default("glm")
+            config.save()
+            self.assertEqual(load_config(self.path).default_alias, "glm")
+
+            config.set_default("gpt")
+            config.save()
+            self.assertEqual(json.loads(self.path.read_text())["default_alias"], "gpt")
+            self.assertEqual(load_config(self.path).default_alias, "gpt")
+
+    def test_save_skips_unchanged_state(self):
+        """Test that saving an unmodified config does not rewrite the file."""
+        load_config(self.path).save()
+        self.assertEqual(self.path.stat().st_mtime_ns, 1_000_000_000)
+
+    def test_save_rewrites_externally_modified_file(self):
+        """Test that save still writes when the file changed since it was loaded."""
+        config = load_config(self.path)
+        self._write({"opus": ["claude", "opus"]}, mtime_ns=2_000_000_000)
+        config.save()
+        self.assertIn("sonnet", json.loads(self.path.read_text())["aliases"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,12 +5,14 @@ import sys
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 import pytest
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ai_cli.cli import _should_skip_file, _read_file_context, _MAX_FILE_SIZE, _MAX_TOTAL_SIZE, _BINARY_EXTENSIONS
+import ai_cli.cli
+from ai_cli.cli import _classify_file, _read_file_context, _MAX_FILE_SIZE, _MAX_TOTAL_SIZE, _BINARY_EXTENSIONS
 
 
 class TestBinaryDetection:
@@ -22,7 +24,7 @@ class TestBinaryDetection:
             for ext in ['.png', '.jpg', '.zip', '.exe', '.so']:
                 path = Path(tmpdir) / f'test{ext}'
                 path.write_bytes(b'fake content')
-                assert _should_skip_file(path), f"Should skip {ext}"
+                assert _classify_file(path).skip, f"Should skip {ext}"
 
     def test_text_extensions_not_skipped(self):
         """Text extensions are not skipped."""
@@ -30,24 +32,33 @@ class TestBinaryDetection:
             for ext in ['.txt', '.py', '.js', '.md', '.json']:
                 path = Path(tmpdir) / f'test{ext}'
                 path.write_text('text content')
-                assert not _should_skip_file(path), f"Should not skip {ext}"
+                assert not _classify_file(path).skip, f"Should not skip {ext}"
+
+    def test_extension_matching(self):
+        """Extensions match case-insensitively, on the last suffix only."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name, skipped in [('IMAGE.PNG', True), ('backup.tar.gz', True),
+                                  ('png', False), ('notes.png.txt', False), ('trailing.', False)]:
+                path = Path(tmpdir) / name
+                path.write_text('text content')
+                assert _classify_file(path).skip is skipped, name
 
     def test_null_byte_detection(self):
         """Files with null bytes are detected as binary."""
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / 'test.bin'
             path.write_bytes(b'text\x00with\x00nulls')
-            assert _should_skip_file(path)
+            assert _classify_file(path).skip
 
-    def test_large_file_skipped(self, capsys):
-        """Files larger than MAX_FILE_SIZE are skipped."""
+    def test_large_file_skipped(self):
+        """Files larger than MAX_FILE_SIZE are skipped with a warning."""
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / 'large.txt'
             # Write a file larger than _MAX_FILE_SIZE
             path.write_bytes(b'x' * (_MAX_FILE_SIZE + 1))
-            assert _should_skip_file(path)
-            captured = capsys.readouterr()
-            assert 'larger than' in captured.err
+            verdict = _classify_file(path)
+            assert verdict.skip
+            assert 'larger than' in verdict.reason
 
     def test_binary_extensions_constant(self):
         """Binary extensions set is comprehensive."""
@@ -195,6 +206,31 @@ class TestSizeLimits:
             # Should get warning about limit
             assert 'limit' in captured.err.lower() or 'skipping' in captured.err.lower()
 
+    def test_no_reads_past_total_limit(self, capsys):
+        """Files past the total size limit are never read in full."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chdir(tmpdir)
+            Path('d').mkdir()
+            for i in range(40):
+                Path(f'd/f{i:02}.txt').write_bytes(b'x' * (900 * 1024))
+            with patch.object(ai_cli.cli, '_read_rest', wraps=ai_cli.cli._read_rest) as read_rest:
+                result = _read_file_context(['d/'])
+            assert result.count('<file path=') == 5
+            assert read_rest.call_count == 5
+            assert 'limit' in capsys.readouterr().err.lower()
+
+    def test_explicit_file_past_limit_not_read(self):
+        """An explicitly named file that doesn't fit is never read."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chdir(tmpdir)
+            names = [f'f{i}.txt' for i in range(8)]
+            for name in names:
+                Path(name).write_bytes(b'x' * (900 * 1024))
+            with patch.object(Path, 'read_bytes', autospec=True, side_effect=Path.read_bytes) as read_bytes:
+                result = _read_file_context([','.join(names)])
+            assert result.count('<file path=') == 5
+            assert read_bytes.call_count == 5
+
     def test_max_file_size_constant(self):
         """Size constants are properly defined."""
         assert _MAX_FILE_SIZE == 1024 * 1024  # 1 MB
@@ -1,99 +1,58 @@
 
-import unittest
-import sys
-import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+import pytest
 from ai_cli.cli import detect_chat_mode
 from ai_cli.config import Config
-from ai_cli.chat import ChatManager
-
-class TestChatRedesign(unittest.TestCase):
-    def setUp(self):
-        self.config = Config()
-        self.config.aliases = {'sonnet': ('claude', 'sonnet'), 'gpt': ('codex', 'gpt')}
-
-    def test_detect_reply(self):
-        argv = ['reply', 'hello']
-        res = detect_chat_mode(argv, self.config)
-        self.assertTrue(res['reply_mode'])
-        self.assertEqual(res['remaining_args'], ['hello'])
-
-    def test_detect_model_reply(self):
-        argv = ['sonnet', 'reply', 'hello']
-        res = detect_chat_mode(argv, self.config)
-        self.assertTrue(res['reply_mode'])
-        self.assertEqual(res['model'], 'sonnet')
-        self.assertEqual(res['remaining_args'], ['hello'])
-
-    def test_detect_reply_flag(self):
-        argv = ['--reply', 'hello']
-        res = detect_chat_mode(argv, self.config)
-        self.assertTrue(res['reply_mode'])
-        self.assertEqual(res['remaining_args'], ['hello'])
-
-    def test_detect_model_reply_flag(self):
-        argv = ['sonnet', '--reply', 'hello']
-        res = detect_chat_mode(argv, self.config)
-        self.assertTrue(res['reply_mode'])
-        self.assertEqual(res['model'], 'sonnet')
-        self.assertEqual(res['remaining_args'], ['hello'])
-
-    def test_detect_chat_id(self):
-        argv = ['chat', 'ABC', 'hello']
-        res = detect_chat_mode(argv, self.config)
-        self.assertEqual(res['chat_id'], 'ABC')
-        self.assertEqual(res['remaining_args'], ['hello'])
-
-    def test_detect_model_chat_id(self):
-        argv = ['sonnet', 'chat', 'ABC', 'hello']
-        res = detect_chat_mode(argv, self.config)
-        self.assertEqual(res['model'], 'sonnet')
-        self.assertEqual(res['chat_id'], 'ABC')
-        self.assertEqual(res['remaining_args'], ['hello'])
-
-    def test_normal_prompt_no_chat_mode(self):
-        argv = ['sonnet', 'hello']
-        res = detect_chat_mode(argv, self.config)
-        self.assertFalse(res['reply_mode'])
-        self.assertIsNone(res['mode'])
-        self.assertIsNone(res['chat_id'])
-
-    def test_chat_list_subcommand(self):
-        argv = ['chat', 'list']
-        res = detect_chat_mode(argv, self.config)
-        self.assertEqual(res['subcommand'], 'list')
-
-    def test_chat_delete_subcommand(self):
-        argv = ['chat', 'delete', 'ABC', 'DEF']
-        res = detect_chat_mode(argv, self.config)
-        self.assertEqual(res['subcommand'], 'delete')
-        self.assertIn('ABC', res['chat_ids'])
-        self.assertIn('DEF', res['chat_ids'])
-
-    def test_chat_id_normalized_to_uppercase(self):
-        argv = ['chat', 'abc', 'hello']
-        res = detect_chat_mode(argv, self.config)
-        self.assertEqual(res['chat_id'], 'ABC')  # normalized to upper
-
-    def test_reply_mode_no_args(self):
-        argv = ['reply']
-        res = detect_chat_mode(argv, self.config)
-        self.assertTrue(res['reply_mode'])
-        self.assertEqual(res['remaining_args'], [])
+from ai_cli.chat import ChatManager, ChatSession
+
+# (argv, expected subset of the detect_chat_mode result)
+_DETECT_CASES = [
+    (['reply', 'hello'], {'reply_mode': True, 'remaining_args': ['hello']}),
+    (['sonnet', 'reply', 'hello'], {'reply_mode': True, 'model': 'sonnet', 'remaining_args': ['hello']}),
+    (['--reply', 'hello'], {'reply_mode': True, 'remaining_args': ['hello']}),
+    (['sonnet', '--reply', 'hello'], {'reply_mode': True, 'model': 'sonnet', 'remaining_args': ['hello']}),
+    (['chat', 'ABC', 'hello'], {'chat_id': 'ABC', 'remaining_args': ['hello']}),
+    (['sonnet', 'chat', 'ABC', 'hello'], {'model': 'sonnet', 'chat_id': 'ABC', 'remaining_args': ['hello']}),
+    # Normal prompt: no chat mode
+    (['sonnet', 'hello'], {'reply_mode': False, 'mode': None, 'chat_id': None}),
+    (['chat', 'list'], {'subcommand': 'list'}),
+    (['chat', 'delete', 'ABC', 'DEF'], {'subcommand': 'delete', 'chat_ids': ['ABC', 'DEF']}),
+    (['chat', 'abc', 'hello'], {'chat_id': 'ABC'}),  # normalized to upper
+    (['reply'], {'reply_mode': True, 'remaining_args': []}),
+]
+
+
+@pytest.fixture(scope="module")
+def config():
+    # A real Config (no file I/O in its constructor); passing aliases skips copying the defaults
+    return Config(aliases={'sonnet': ('claude', 'sonnet'), 'gpt': ('codex', 'gpt')})
+
+
+@pytest.mark.parametrize("argv,expected", _DETECT_CASES, ids=[" ".join(argv) for argv, _ in _DETECT_CASES])
+def test_detect_chat_mode(argv, expected, config):
+    res = detect_chat_mode(argv, config)
+    for key, value in expected.items():
+        assert res[key] == value, key
+
+
+class TestChatManagerGetLatest:
+    """Tests for the optimized get_latest method."""
 
+    @patch.object(ChatManager, '_scan', return_value=[])
+    def test_get_latest_returns_none_when_empty(self, mock_scan):
+        """get_latest returns None when no sessions exist."""
+        assert ChatManager.get_latest() is None
+        mock_scan.assert_called_once_with()
 
-class TestChatManagerGetLatest(unittest.TestCase):
-    """Tests for the optimized get_latest method."""
+    @patch.object(ChatSession, 'load')
+    @patch.object(ChatManager, '_scan', return_value=[(100, 'OLD'), (300, 'NEW'), (200, 'MID')])
+    def test_get_latest_loads_only_newest(self, mock_scan, mock_load):
+        """get_latest loads just the file with the newest mtime."""
+        session = ChatSession(chat_id='NEW', model_alias='sonnet')
+        mock_load.return_value = session
+        assert ChatManager.get_latest() is session
+        mock_load.assert_called_once_with('NEW')
 
-    def test_get_latest_returns_none_when_empty(self):
-        """Test that get_latest returns None when no sessions exist."""
-        # This test assumes no chat sessions exist in test environment
-        # In real tests, we'd need proper setup/teardown
-        latest = ChatManager.get_latest()
-        # The result should either be None or a valid ChatSession
-        if latest is not None:
-            from ai_cli.chat import ChatSession
-            self.assertIsInstance(latest, ChatSession)
 
-if __name__ == "__main__":
-    unittest.main()
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,153 @@
+"""Unit tests for the ai-cli HTTP server."""
+
+import http.client
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+import json
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from ai_cli.config import Config
+from ai_cli.server import AIHandler, PooledHTTPServer
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+class TestPooledHTTPServerShutdown(unittest.TestCase):
+    """Test that closing the pooled server never waits on open connections."""
+
+    def test_process_exits_with_request_in_progress(self):
+        """Test that server_close() returns and the process exits while a worker is busy."""
+        script = textwrap.dedent("""
+            import socket, threading, time
+            from http.server import BaseHTTPRequestHandler
+            from ai_cli.server import PooledHTTPServer
+
+            started = threading.Event()
+
+            class SlowHandler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    started.set()
+                    time.sleep(60)  # a long-running /call
+
+            httpd = PooledHTTPServer(("127.0.0.1", 0), SlowHandler, max_workers=2)
+            threading.Thread(target=httpd.serve_forever, daemon=True).start()
+            conn = socket.create_connection(httpd.server_address)
+            conn.sendall(b"GET / HTTP/1.1\\r\\nHost: test\\r\\n\\r\\n")
+            assert started.wait(10)
+            httpd.shutdown()
+            httpd.server_close()
+            print("closed")
+        """)
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=REPO_ROOT, capture_output=True, text=True, timeout=20,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "closed")
+
+
+class TestKeepAlive(unittest.TestCase):
+    """Test that idle keep-alive connections don't starve the worker pool."""
+
+    def _start_server(self, keepalive_timeout: float, max_workers: int) -> PooledHTTPServer:
+        handler = type("Handler", (AIHandler,), {"KEEPALIVE_TIMEOUT": keepalive_timeout})
+        httpd = PooledHTTPServer(("127.0.0.1", 0), handler, max_workers=max_workers)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        self.addCleanup(httpd.server_close)
+        self.addCleanup(httpd.shutdown)
+        return httpd
+
+    def _connect(self, httpd: PooledHTTPServer) -> http.client.HTTPConnection:
+        conn = http.client.HTTPConnection(*httpd.server_address, timeout=10)
+        self.addCleanup(conn.close)
+        return conn
+
+    def _health(self, conn: http.client.HTTPConnection) -> http.client.HTTPResponse:
+        conn.request("GET", "/health")
+        response = conn.getresponse()
+        response.read()
+        return response
+
+    def test_idle_connection_closed_after_keepalive_timeout(self):
+        """Test that the server drops a keep-alive connection once it idles out."""
+        httpd = self._start_server(keepalive_timeout=0.2, max_workers=1)
+        conn = self._connect(httpd)
+        self.assertIsNone(self._health(conn).getheader("Connection"))
+
+        start = time.monotonic()
+        self.assertEqual(conn.sock.recv(1), b"")  # EOF: server closed its end
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_connection_close_sent_when_pool_saturated(self):
+        """Test that a response tells the client to close while others wait for a worker."""
+        httpd = self._start_server(keepalive_timeout=30, max_workers=1)
+        first = self._connect(httpd)
+        self.assertIsNone(self._health(first).getheader("Connection"))
+
+        # The only worker is held by `first`, so this connection queues
+        second = self._connect(httpd)
+        second.connect()
+        deadline = time.monotonic() + 5
+        while not httpd.saturated():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+        self.assertEqual(self._health(first).getheader("Connection"), "close")
+        self.assertEqual(self._health(second).status, 200)
+
+
+class TestModelsEndpoint(unittest.TestCase):
+    """Test the cached /models response."""
+
+    def setUp(self):
+        """Start a server whose client config can be mutated in place."""
+        self.config = Config(aliases={"sonnet": ("claude", "sonnet")})
+        handler = type("Handler", (AIHandler,), {
+            "client": SimpleNamespace(config=self.config),
+            "auth_token": None,
+        })
+        AIHandler._models_cache = None
+        self.addCleanup(setattr, AIHandler, "_models_cache", None)
+        self.httpd = PooledHTTPServer(("127.0.0.1", 0), handler, max_workers=1)
+        threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True).start()
+        self.addCleanup(self.httpd.server_close)
+        self.addCleanup(self.httpd.shutdown)
+
+        self.conn = http.client.HTTPConnection(*self.httpd.server_address, timeout=10)
+        self.addCleanup(self.conn.close)
+
+    def _models(self) -> dict:
+        # One keep-alive connection: the single worker serves every request on it
+        self.conn.request("GET", "/models")
+        return json.loads(self.conn.getresponse().read())["models"]
+
+    def test_responses_carry_date_and_server(self):
+        """Test that the single-write responses still send the Date and Server headers."""
+        for path in ("/health", "/models"):
+            with self.subTest(path=path):
+                self.conn.request("GET", path)
+                response = self.conn.getresponse()
+                response.read()
+                self.assertEqual(response.getheader("Server"), f"{AIHandler.server_version} {AIHandler.sys_version}")
+                self.assertIsNotNone(response.getheader("Date"))
+                self.assertEqual(response.getheader("Content-Type"), "application/json")
+
+    def test_reflects_in_place_alias_changes(self):
+        """Test that add_alias()/remove_alias() on the live Config show up in /models."""
+        self.assertEqual(list(self._models()), ["sonnet"])
+
+        self.config.add_alias("opus", "claude", "opus")
+        models = self._models()
+        self.assertEqual(models["opus"], {"provider": "claude", "model": "opus"})
+
+        self.config.remove_alias("sonnet")
+        self.assertEqual(list(self._models()), ["opus"])
+
+
+if __name__ == "__main__":
+    unittest.main()